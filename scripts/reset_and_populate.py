@@ -24,8 +24,11 @@ from spendsense.app.db.models import (
     Persona, Recommendation
 )
 from spendsense.app.features import credit, income, savings, subscriptions
-from spendsense.app.personas.assign import assign_persona
-from spendsense.app.recommend.engine import generate_recommendations
+from spendsense.app.personas.assign import assign_personas
+from spendsense.app.recommend.engine import (
+    generate_recommendations,
+    generate_recommendations_batch,
+)
 from spendsense.app.core.logging import get_logger
 
 
@@ -107,6 +110,53 @@ def compute_and_store_signals(user_id: str, window_days: int, session):
     logger.info(f"Signals computed for {user_id}")
 
 
+# Users per batch; keeps the IN (...) lists well under SQLite's bound-variable limit
+RECOMMENDATION_BATCH_SIZE = 500
+
+
+def generate_window_recommendations(user_ids: list[str], window_days: int, session):
+    """
+    Generate recommendations for many users in one window, batch by batch.
+    
+    If a batch fails it is rolled back and retried user by user, so one bad
+    user only costs that user's recommendations.
+    
+    Returns:
+        Tuple of (recommendations by user_id, user_ids that failed)
+    """
+    recommendations = {}
+    failed_ids = []
+
+    for start in range(0, len(user_ids), RECOMMENDATION_BATCH_SIZE):
+        batch = user_ids[start:start + RECOMMENDATION_BATCH_SIZE]
+        try:
+            recommendations.update(
+                generate_recommendations_batch(batch, window_days, session)
+            )
+            continue
+        except Exception as e:
+            logger.warning(
+                f"Batch recommendation generation failed (window={window_days}d), "
+                f"retrying per user: {e}"
+            )
+            session.rollback()
+
+        for user_id in batch:
+            try:
+                recommendations[user_id] = generate_recommendations(
+                    user_id, window_days, session
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error generating recommendations for {user_id} "
+                    f"(window={window_days}d): {e}"
+                )
+                session.rollback()
+                failed_ids.append(user_id)
+
+    return recommendations, failed_ids
+
+
 def main():
     """Reset database and populate with complete data."""
     print("=" * 70)
@@ -156,35 +206,45 @@ def main():
         
         successful = 0
         failed = 0
+        processed_ids = []
         
         for idx, user_id in enumerate(user_ids, 1):
             print(f"[{idx}/{total_users}] Processing {user_id}...", end=" ")
             
-            for window_days in [30, 180]:
-                try:
-                    # Step 1: Compute and store signals
+            try:
+                # Step 1: Compute and store signals
+                for window_days in [30, 180]:
                     compute_and_store_signals(user_id, window_days, session)
-                    
-                    # Step 2: Assign persona
-                    persona = assign_persona(user_id, window_days, session)
-                    
-                    # Step 3: Generate recommendations
-                    recommendations = generate_recommendations(
-                        user_id, window_days, session
-                    )
-                    
-                except Exception as e:
-                    logger.error(
-                        f"Error processing {user_id} (window={window_days}d): {e}"
-                    )
-                    session.rollback()
-                    failed += 1
-                    print(f"❌ FAILED ({e})")
-                    break
+
+                # Step 2: Assign personas for both windows in one pass
+                assign_personas(user_id, session, windows=(30, 180))
+
+            except Exception as e:
+                logger.error(f"Error processing {user_id}: {e}")
+                session.rollback()
+                failed += 1
+                print(f"❌ FAILED ({e})")
             else:
-                # Only executed if loop completed without break
-                successful += 1
+                processed_ids.append(user_id)
                 print("✓")
+
+        # Step 3: Generate recommendations for all processed users, batched per window
+        print()
+        print("Generating recommendations...", end=" ")
+        failed_ids = set()
+        for window_days in [30, 180]:
+            _, window_failed_ids = generate_window_recommendations(
+                processed_ids, window_days, session
+            )
+            failed_ids.update(window_failed_ids)
+
+        # A user counts as failed if either window's recommendations failed
+        failed += len(failed_ids)
+        successful = len(processed_ids) - len(failed_ids)
+        if failed_ids:
+            print(f"❌ FAILED for {len(failed_ids)} users (see log)")
+        else:
+            print("✓")
     
     print()
     print("=" * 70)
@@ -116,7 +116,8 @@ def signup(
     }
     access_token = create_access_token(token_data)
     
-    return TokenResponse(
+    # Fields are handler-built values of the declared types; skip validation
+    return TokenResponse.model_construct(
         access_token=access_token,
         token_type="bearer",
         user_id=new_user.user_id,
@@ -205,7 +206,8 @@ def login(
     }
     access_token = create_access_token(token_data)
     
-    return TokenResponse(
+    # Fields are handler-built values of the declared types; skip validation
+    return TokenResponse.model_construct(
         access_token=access_token,
         token_type="bearer",
         user_id=user.user_id,
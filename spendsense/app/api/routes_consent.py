@@ -81,7 +81,8 @@ async def record_consent_action(
             session=db,
         )
 
-        return ConsentResponse(
+        # Fields are handler-built values of the declared types; skip validation
+        return ConsentResponse.model_construct(
             success=True,
             user_id=user_id,
             action=consent_data.action,
@@ -14,15 +14,20 @@ Auth: All endpoints require operator role
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from spendsense.app.auth.dependencies import require_operator
 from spendsense.app.core.logging import get_logger
 from spendsense.app.db.models import OperatorReview, Recommendation, User
 from spendsense.app.db.session import get_db
-from spendsense.app.schemas.operator import ApprovalRequest, ApprovalResponse, OperatorReviewResponse
-from spendsense.app.schemas.recommendation import RecommendationItem
+from spendsense.app.schemas.operator import (
+    ApprovalRequest,
+    ApprovalResponse,
+    OperatorReviewResponse,
+    OperatorReviewResponseListAdapter,
+)
+from spendsense.app.schemas.recommendation import RecommendationItem, RecommendationItemListAdapter
 from spendsense.app.eval.traces import build_decision_trace
 
 logger = get_logger(__name__)
@@ -36,7 +41,7 @@ async def get_review_queue(
     status_filter: str | None = Query(default="pending", description="Filter by status"),
     limit: int | None = Query(default=20, ge=1, le=100, description="Max items to return"),
     offset: int | None = Query(default=0, ge=0, description="Offset for pagination"),
-) -> list[RecommendationItem]:
+) -> Response:
     """
     Get operator review queue.
     
@@ -92,7 +97,10 @@ async def get_review_queue(
         status_filter=status_filter,
     )
 
-    return [RecommendationItem.model_validate(rec) for rec in recommendations]
+    # Serialize with the shared adapter; returning a Response skips
+    # FastAPI's response_model re-validation of already-built items
+    items = [RecommendationItem.from_orm_trusted(rec) for rec in recommendations]
+    return Response(content=RecommendationItemListAdapter.dump_json(items), media_type="application/json")
 
 
 @router.post("/recommendations/{recommendation_id}/approve", response_model=ApprovalResponse)
@@ -172,7 +180,8 @@ async def approve_recommendation(
         reviewer=approval.reviewer,
     )
 
-    return ApprovalResponse(
+    # Fields are handler-built values of the declared types; skip validation
+    return ApprovalResponse.model_construct(
         success=True,
         message=f"Recommendation {approval.status} successfully",
         review_id=review.id,
@@ -184,7 +193,7 @@ async def get_recommendation_reviews(
     recommendation_id: int,
     current_user: Annotated[User, Depends(require_operator)],
     db: Annotated[Session, Depends(get_db)],
-) -> list[OperatorReviewResponse]:
+) -> Response:
     """
     Get all reviews for a specific recommendation.
     
@@ -208,7 +217,8 @@ async def get_recommendation_reviews(
         OperatorReview.recommendation_id == recommendation_id
     ).order_by(OperatorReview.decided_at.desc()).all()
 
-    return [OperatorReviewResponse.model_validate(review) for review in reviews]
+    items = [OperatorReviewResponse.from_orm_trusted(review) for review in reviews]
+    return Response(content=OperatorReviewResponseListAdapter.dump_json(items), media_type="application/json")
 
 
 @router.get("/fairness")
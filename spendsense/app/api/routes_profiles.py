@@ -15,17 +15,12 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from spendsense.app.auth.dependencies import get_optional_user
+from spendsense.app.core import json_utils
 from spendsense.app.core.logging import get_logger
-from spendsense.app.db.models import (
-    CreditSignal,
-    IncomeSignal,
-    Persona,
-    SavingsSignal,
-    SubscriptionSignal,
-    User,
-)
+from spendsense.app.db.models import Persona, User
 from spendsense.app.db.session import get_db
 from spendsense.app.guardrails.consent import check_consent, get_consent_status
+from spendsense.app.personas.assign import fetch_all_signals
 from spendsense.app.schemas.signal import (
     CreditSignalData,
     IncomeSignalData,
@@ -40,7 +35,7 @@ router = APIRouter()
 @router.get("/{user_id}")
 async def get_profile(
     user_id: str,
-    window: int | None = Query(default=30, description="Time window in days (30 or 180)"),
+    window: int = Query(default=30, description="Time window in days (30 or 180)"),
     db: Session = Depends(get_db),
     current_user: Annotated[User | None, Depends(get_optional_user)] = None,
 ) -> dict:
@@ -134,7 +129,7 @@ async def get_profile(
         criteria = None
         if persona.criteria_met:
             try:
-                criteria = json.loads(persona.criteria_met)
+                criteria = json_utils.loads(persona.criteria_met)
             except json.JSONDecodeError:
                 logger.warning("invalid_criteria_json", user_id=user_id)
 
@@ -146,26 +141,12 @@ async def get_profile(
             "assigned_at": persona.assigned_at.isoformat(),
         }
 
-    # Get all signals
-    subscription_signal = db.query(SubscriptionSignal).filter(
-        SubscriptionSignal.user_id == user_id,
-        SubscriptionSignal.window_days == window,
-    ).first()
-
-    savings_signal = db.query(SavingsSignal).filter(
-        SavingsSignal.user_id == user_id,
-        SavingsSignal.window_days == window,
-    ).first()
-
-    credit_signal = db.query(CreditSignal).filter(
-        CreditSignal.user_id == user_id,
-        CreditSignal.window_days == window,
-    ).first()
-
-    income_signal = db.query(IncomeSignal).filter(
-        IncomeSignal.user_id == user_id,
-        IncomeSignal.window_days == window,
-    ).first()
+    # Get all signals (one query per signal type)
+    window_signals = fetch_all_signals(user_id, db, windows=(window,))[window]
+    subscription_signal = window_signals["subscription"]
+    savings_signal = window_signals["savings"]
+    credit_signal = window_signals["credit"]
+    income_signal = window_signals["income"]
 
     # Build signal summary
     signals = {
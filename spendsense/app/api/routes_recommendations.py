@@ -10,7 +10,7 @@ Endpoints:
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from spendsense.app.auth.dependencies import get_optional_user
@@ -19,12 +19,27 @@ from spendsense.app.db.models import Recommendation, User
 from spendsense.app.db.session import get_db
 from spendsense.app.guardrails.consent import check_consent, get_consent_status
 from spendsense.app.recommend.engine import generate_recommendations
-from spendsense.app.schemas.recommendation import FeedbackRequest, FeedbackResponse, RecommendationItem
+from spendsense.app.schemas.recommendation import (
+    FeedbackRequest,
+    FeedbackResponse,
+    RecommendationItem,
+    RecommendationItemListAdapter,
+)
 
 logger = get_logger(__name__)
 router = APIRouter()
 
 
+def _json_response(items: list[RecommendationItem]) -> Response:
+    """
+    Serialize recommendations with the shared list adapter.
+    
+    Returning a Response skips FastAPI's response_model re-validation (the
+    items are already built); response_model is still used for the docs.
+    """
+    return Response(content=RecommendationItemListAdapter.dump_json(items), media_type="application/json")
+
+
 @router.get("/{user_id}", response_model=list[RecommendationItem])
 async def get_recommendations(
     user_id: str,
@@ -32,7 +47,7 @@ async def get_recommendations(
     regenerate: bool | None = Query(default=False, description="Force regenerate recommendations"),
     db: Session = Depends(get_db),
     current_user: Annotated[User | None, Depends(get_optional_user)] = None,
-) -> list[RecommendationItem]:
+) -> Response:
     """
     Get personalized recommendations for a user.
     
@@ -119,7 +134,7 @@ async def get_recommendations(
 
         if existing_recs:
             logger.debug("returning_existing_recommendations", user_id=user_id, window_days=window, count=len(existing_recs))
-            return [RecommendationItem.model_validate(rec) for rec in existing_recs]
+            return _json_response([RecommendationItem.from_orm_trusted(rec) for rec in existing_recs])
 
     # Generate new recommendations
     try:
@@ -132,7 +147,7 @@ async def get_recommendations(
             window_days=window_days,
             count=len(recommendations),
         )
-        return recommendations
+        return _json_response(recommendations)
 
     except Exception as e:
         logger.error(
@@ -195,7 +210,8 @@ async def record_feedback(
         notes=feedback.notes,
     )
 
-    return FeedbackResponse(
+    # Fields are handler-built values of the declared types; skip validation
+    return FeedbackResponse.model_construct(
         success=True,
         message="Feedback recorded successfully (stub implementation)",
     )
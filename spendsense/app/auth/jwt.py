@@ -15,11 +15,12 @@ How it works:
 - Uses python-jose for JWT operations
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Any
 
 from jose import JWTError, jwt
 
+from spendsense.app.core.clock import utcnow
 from spendsense.app.core.config import settings
 
 
@@ -77,9 +78,9 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
     
     # Set expiration time
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+        expire = utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     
     # Add expiration to payload
     to_encode.update({"exp": expire})
@@ -19,18 +19,21 @@ Note: Bcrypt has a 72-byte password limit. Passwords are truncated if longer.
 
 from passlib.context import CryptContext
 
+from spendsense.app.core.config import settings
+
 # Create password context with bcrypt
 # Why bcrypt:
 # - Industry standard for password hashing
 # - Automatic salting
-# - Configurable work factor (rounds)
+# - Configurable work factor (rounds, settings.bcrypt_rounds; hashes store their
+#   own rounds, so changing it never breaks verification of existing passwords)
 # - Resistant to rainbow table and brute force attacks
 # 
 # Note: We configure it to handle bcrypt's 72-byte limitation gracefully
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
-    bcrypt__default_rounds=12,
+    bcrypt__default_rounds=settings.bcrypt_rounds,
     bcrypt__default_ident="2b"
 )
 
@@ -0,0 +1,63 @@
+"""
+Current-time helper with an optional per-batch frozen value.
+
+Why this exists:
+- Create schemas stamp created_at/timestamp with the current time, once per row
+- Bulk paths (synthetic data, CSV/JSON ingest) build thousands of rows, and
+  one timestamp per batch is both cheaper and more consistent
+- Timestamps stay naive UTC to match what the database columns store
+- Date validators ask for "today" once per row; a batch asks the clock once
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, date, datetime
+
+_BATCH_NOW: ContextVar[datetime | None] = ContextVar("batch_now", default=None)
+_BATCH_TODAY: ContextVar[date | None] = ContextVar("batch_today", default=None)
+
+
+def utcnow() -> datetime:
+    """
+    Return the current naive UTC time, or the frozen batch time if one is set.
+    
+    Drop-in replacement for datetime.utcnow (deprecated in Python 3.12).
+    """
+    frozen = _BATCH_NOW.get()
+    if frozen is not None:
+        return frozen
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def today() -> date:
+    """
+    Return the current local date, or the frozen batch date if one is set.
+    
+    Same meaning as date.today() (local, not UTC), so "not in the future"
+    checks behave exactly as before.
+    """
+    frozen = _BATCH_TODAY.get()
+    if frozen is not None:
+        return frozen
+    return date.today()
+
+
+@contextmanager
+def frozen_utcnow() -> Iterator[datetime]:
+    """
+    Make utcnow() and today() return fixed values for the duration of a batch.
+    
+    Example:
+        with frozen_utcnow():
+            rows = [TransactionCreate(**record) for record in records]
+        # every row gets the same created_at
+    """
+    now = utcnow()
+    token = _BATCH_NOW.set(now)
+    today_token = _BATCH_TODAY.set(today())
+    try:
+        yield now
+    finally:
+        _BATCH_TODAY.reset(today_token)
+        _BATCH_NOW.reset(token)
@@ -91,6 +91,12 @@ class Settings(BaseSettings):
         default=1440,  # 24 hours
         description="JWT access token expiration time in minutes"
     )
+    bcrypt_rounds: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt work factor for new password hashes (lowered only in tests)"
+    )
 
     # Fairness & Evaluation Configuration
     fairness_threshold: int = Field(
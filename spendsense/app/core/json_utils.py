@@ -0,0 +1,49 @@
+"""
+JSON decoding helpers.
+
+Why this exists:
+- Personas and recommendations store JSON in text columns (criteria_met,
+  eligibility_flags) that are decoded on every read
+- orjson decodes several times faster than stdlib json, but is optional
+- One place to decide which decoder runs, instead of each caller choosing
+"""
+
+import json
+from typing import Any
+
+# Optional dependency (fall back to stdlib json when missing)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Decode a JSON document with orjson when available.
+    
+    Raises json.JSONDecodeError on invalid input with either decoder
+    (orjson.JSONDecodeError subclasses it), so existing except clauses work.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_json_object(value: Any) -> dict[str, Any] | None:
+    """
+    Turn a JSON text column into a dict.
+    
+    Dicts pass through unchanged; None, invalid JSON and JSON that isn't an
+    object all become None.
+    """
+    if isinstance(value, dict):
+        return value
+    if not isinstance(value, (str, bytes)):
+        return None
+    try:
+        parsed = loads(value)
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
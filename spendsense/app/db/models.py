@@ -36,6 +36,8 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+from spendsense.app.core.clock import utcnow
+
 
 class Base(DeclarativeBase):
     """
@@ -81,7 +83,7 @@ class User(Base):
     ethnicity: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow)
 
     # Relationships to other tables
     # These enable ORM queries like: user.accounts, user.transactions
@@ -125,7 +127,7 @@ class Account(Base):
     credit_limit: Mapped[Decimal | None] = mapped_column(Numeric(15, 2), nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="accounts")
@@ -170,7 +172,7 @@ class Transaction(Base):
     payment_channel: Mapped[str | None] = mapped_column(String(20), nullable=True)  # online, in store, other
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow)
 
     # Relationships
     account: Mapped["Account"] = relationship("Account", back_populates="transactions")
@@ -221,7 +223,7 @@ class Liability(Base):
     is_overdue: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="liabilities")
@@ -252,7 +254,7 @@ class ConsentEvent(Base):
     consent_given_by: Mapped[str] = mapped_column(String(100), nullable=False)  # user_dashboard, api, operator
 
     # Timestamp
-    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow, index=True)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="consent_events")
@@ -288,7 +290,7 @@ class Persona(Base):
 
     # Explainability
     criteria_met: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON of criteria
-    assigned_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    assigned_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="personas")
@@ -327,7 +329,7 @@ class Recommendation(Base):
 
     # Status tracking
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")  # pending, approved, rejected
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow)
 
     def __repr__(self) -> str:
         return f"<Recommendation(id={self.id}, type='{self.item_type}', user='{self.user_id}', window={self.window_days}d)>"
@@ -354,7 +356,7 @@ class OperatorReview(Base):
     status: Mapped[str] = mapped_column(String(20), nullable=False)  # approved, rejected, flagged
     reviewer: Mapped[str] = mapped_column(String(100), nullable=False)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
-    decided_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    decided_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow)
 
     def __repr__(self) -> str:
         return f"<OperatorReview(id={self.id}, recommendation={self.recommendation_id}, status='{self.status}')>"
@@ -387,7 +389,7 @@ class SubscriptionSignal(Base):
     subscription_share_pct: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False, default=0)
 
     # Timestamp
-    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User")
@@ -426,7 +428,7 @@ class SavingsSignal(Base):
     emergency_fund_months: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False, default=0)
 
     # Timestamp
-    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User")
@@ -474,7 +476,7 @@ class CreditSignal(Base):
     is_overdue: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     # Timestamp
-    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User")
@@ -517,7 +519,7 @@ class IncomeSignal(Base):
     cashflow_buffer_months: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False, default=0)
 
     # Timestamp
-    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User")
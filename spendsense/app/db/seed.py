@@ -20,7 +20,7 @@ Usage:
 import csv
 import json
 import random
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from decimal import Decimal
 from typing import Any
 
@@ -28,6 +28,7 @@ from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from spendsense.app.auth.password import hash_password
+from spendsense.app.core.clock import frozen_utcnow, utcnow
 from spendsense.app.core.config import settings
 from spendsense.app.core.logging import get_logger
 from spendsense.app.db.models import (
@@ -41,7 +42,7 @@ from spendsense.app.db.session import get_session
 from spendsense.app.schemas.account import AccountCreate
 from spendsense.app.schemas.consent_event import ConsentEventCreate
 from spendsense.app.schemas.liability import LiabilityCreate
-from spendsense.app.schemas.transaction import TransactionCreate
+from spendsense.app.schemas.transaction import TransactionCreate, validate_transactions
 from spendsense.app.schemas.user import UserCreate
 
 logger = get_logger(__name__)
@@ -263,7 +264,7 @@ def generate_users(n: int = 50) -> list[User]:
                 age_range=demographics["age_range"],
                 gender=demographics["gender"],
                 ethnicity=demographics["ethnicity"],
-                created_at=datetime.utcnow() - timedelta(days=random.randint(180, 730))
+                created_at=utcnow() - timedelta(days=random.randint(180, 730))
             )
 
             # Convert to ORM model
@@ -1041,7 +1042,7 @@ def seed_database() -> None:
     """
     logger.info("starting_database_seed", seed=settings.seed)
 
-    with next(get_session()) as session:
+    with next(get_session()) as session, frozen_utcnow():
         # Create operator account first
         operator_password_hash = hash_password("operator123")
         operator_demographics = generate_demographics()  # Operator needs demographics too for fairness analysis
@@ -1054,7 +1055,7 @@ def seed_database() -> None:
             age_range=operator_demographics["age_range"],
             gender=operator_demographics["gender"],
             ethnicity=operator_demographics["ethnicity"],
-            created_at=datetime.utcnow()
+            created_at=utcnow()
         )
         session.add(operator)
         session.flush()
@@ -1155,7 +1156,7 @@ def ingest_from_csv(file_path: str) -> dict[str, Any]:
         with open(file_path) as csvfile:
             reader = csv.DictReader(csvfile)
 
-            with next(get_session()) as session:
+            with next(get_session()) as session, frozen_utcnow():
                 for row_num, row in enumerate(reader, start=1):
                     try:
                         # Attempt to validate and create user (assuming users CSV for now)
@@ -1233,24 +1234,21 @@ def ingest_from_json(file_path: str) -> dict[str, Any]:
             if not isinstance(data, list):
                 data = [data]
 
-            with next(get_session()) as session:
-                for idx, record in enumerate(data, start=1):
-                    try:
-                        # Attempt to validate and create transaction (assuming transactions JSON for now)
-                        tx_data = TransactionCreate(**record)
-                        tx = Transaction(**tx_data.model_dump())
-                        session.add(tx)
-                        results["success_count"] += 1
-                    except ValidationError as e:
-                        error_msg = f"Record {idx}: {str(e)}"
-                        results["errors"].append(error_msg)  # type: ignore
-                        results["error_count"] += 1
-                        logger.warning("json_validation_error", record=idx, error=str(e))
-                    except Exception as e:
-                        error_msg = f"Record {idx}: Unexpected error - {str(e)}"
-                        results["errors"].append(error_msg)  # type: ignore
-                        results["error_count"] += 1
-                        logger.error("json_ingestion_error", record=idx, error=str(e))
+            with next(get_session()) as session, frozen_utcnow():
+                # Validate the whole batch in one pass (assuming transactions JSON for now)
+                valid, errors = validate_transactions(data)
+
+                for idx, record_errors in errors.items():
+                    details = "; ".join(
+                        f"{'.'.join(str(part) for part in err['loc']) or 'record'}: {err['msg']}"
+                        for err in record_errors
+                    )
+                    results["errors"].append(f"Record {idx + 1}: {details}")  # type: ignore
+                    logger.warning("json_validation_error", record=idx + 1, error=details)
+                results["error_count"] = len(errors)
+
+                session.add_all([Transaction(**tx_data.model_dump()) for tx_data in valid])
+                results["success_count"] = len(valid)
 
                 # Commit valid records even if some failed
                 session.commit()
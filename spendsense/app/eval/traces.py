@@ -18,12 +18,13 @@ Why this exists:
 """
 
 import json
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from sqlalchemy.orm import Session
 
+from spendsense.app.core import json_utils
+from spendsense.app.core.clock import utcnow
 from spendsense.app.core.logging import get_logger
 from spendsense.app.db.models import (
     CreditSignal,
@@ -83,7 +84,7 @@ def build_decision_trace(
         criteria = {}
         if persona.criteria_met:
             try:
-                criteria = json.loads(persona.criteria_met)
+                criteria = json_utils.loads(persona.criteria_met)
             except json.JSONDecodeError:
                 criteria = {"raw": persona.criteria_met}
 
@@ -168,7 +169,7 @@ def build_decision_trace(
         eligibility = {}
         if rec.eligibility_flags:
             try:
-                eligibility = json.loads(rec.eligibility_flags)
+                eligibility = json_utils.loads(rec.eligibility_flags)
             except json.JSONDecodeError:
                 eligibility = {"raw": rec.eligibility_flags}
 
@@ -193,7 +194,7 @@ def build_decision_trace(
         "signal_count": len(signals),
         "recommendations": recs_data,
         "recommendation_count": len(recs_data),
-        "trace_generated_at": datetime.utcnow().isoformat(),
+        "trace_generated_at": utcnow().isoformat(),
     }
 
     return trace
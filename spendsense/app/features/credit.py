@@ -21,13 +21,28 @@ from datetime import date, timedelta
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from spendsense.app.core.logging import get_logger
 from spendsense.app.db.models import Account, CreditSignal, Liability, Transaction
 
 logger = get_logger(__name__)
 
+# Decimal constants, built once instead of on every call
+ZERO = Decimal("0.00")
+HUNDRED = Decimal("100.0")
+MINIMUM_PAYMENT_TOLERANCE = Decimal("1.1")  # last payment within 10% of the minimum
+
+# Liability columns read by the utilization and behavior checks below
+CREDIT_SIGNAL_COLUMNS = (
+    Liability.account_id,
+    Liability.current_balance,
+    Liability.credit_limit,
+    Liability.minimum_payment,
+    Liability.last_payment_amount,
+    Liability.is_overdue,
+)
+
 
 def compute_credit_utilization(
     liabilities: list[Liability],
@@ -68,7 +83,7 @@ def compute_credit_utilization(
     for liab in liabilities:
         # Only calculate if we have a valid credit limit
         if liab.credit_limit and liab.credit_limit > 0:
-            util_pct = (liab.current_balance / liab.credit_limit) * Decimal("100.0")
+            util_pct = (liab.current_balance / liab.credit_limit) * HUNDRED
             utilizations.append(float(util_pct))
 
     if utilizations:
@@ -150,7 +165,7 @@ def check_credit_flags(
         # If last payment ≈ minimum payment (within 10%), user is paying minimum only
         if liab.last_payment_amount and liab.minimum_payment:
             # Payment is within 10% of minimum = minimum-only
-            if liab.last_payment_amount <= liab.minimum_payment * Decimal("1.1"):
+            if liab.last_payment_amount <= liab.minimum_payment * MINIMUM_PAYMENT_TOLERANCE:
                 has_minimum_payment_only = True
 
         # Check overdue status
@@ -203,8 +218,10 @@ def compute_credit_signals(
     # Calculate cutoff date
     cutoff_date = date.today() - timedelta(days=window_days)
 
-    # Get user's credit card liabilities
-    liabilities = session.query(Liability).filter(
+    # Get user's credit card liabilities (only the columns the signals read)
+    liabilities = session.query(Liability).options(
+        load_only(*CREDIT_SIGNAL_COLUMNS)
+    ).filter(
         Liability.user_id == user_id,
         Liability.liability_type == "credit_card"
     ).all()
@@ -214,8 +231,8 @@ def compute_credit_signals(
         return CreditSignal(
             user_id=user_id,
             window_days=window_days,
-            credit_utilization_max_pct=Decimal("0.00"),
-            credit_utilization_avg_pct=Decimal("0.00"),
+            credit_utilization_max_pct=ZERO,
+            credit_utilization_avg_pct=ZERO,
             credit_util_flag_30=False,
             credit_util_flag_50=False,
             credit_util_flag_80=False,
@@ -28,6 +28,9 @@ from spendsense.app.db.models import Account, IncomeSignal, Transaction
 
 logger = get_logger(__name__)
 
+# Decimal constants, built once instead of on every call
+ZERO = Decimal("0.00")
+
 
 def detect_payroll_transactions(
     transactions: list[Transaction]
@@ -193,10 +196,10 @@ def compute_income_signals(
             user_id=user_id,
             window_days=window_days,
             payroll_deposit_count=0,
-            median_pay_gap_days=Decimal("0.00"),
-            pay_gap_variability=Decimal("0.00"),
-            avg_payroll_amount=Decimal("0.00"),
-            cashflow_buffer_months=Decimal("0.00")
+            median_pay_gap_days=ZERO,
+            pay_gap_variability=ZERO,
+            avg_payroll_amount=ZERO,
+            cashflow_buffer_months=ZERO
         )
 
     account_ids = [acc.account_id for acc in accounts]
@@ -231,15 +234,15 @@ def compute_income_signals(
         # Calculate average monthly expenses
         months_in_window = Decimal(str(window_days / 30.0))
         total_expenses = sum(tx.amount for tx in checking_txs)
-        avg_monthly_expenses = total_expenses / months_in_window if months_in_window > 0 else Decimal("0.00")
+        avg_monthly_expenses = total_expenses / months_in_window if months_in_window > 0 else ZERO
 
         # Calculate buffer
         if avg_monthly_expenses > 0:
             cashflow_buffer_months = checking_balance / avg_monthly_expenses
         else:
-            cashflow_buffer_months = Decimal("0.00")
+            cashflow_buffer_months = ZERO
     else:
-        cashflow_buffer_months = Decimal("0.00")
+        cashflow_buffer_months = ZERO
 
     # Create signal model
     signal = IncomeSignal(
@@ -25,6 +25,11 @@ from spendsense.app.db.models import Account, SavingsSignal, Transaction
 
 logger = get_logger(__name__)
 
+# Decimal constants, built once instead of on every call
+ZERO = Decimal("0.00")
+HUNDRED = Decimal("100.0")
+DAYS_PER_MONTH = Decimal("30.0")
+
 
 def compute_savings_signals(
     user_id: str,
@@ -83,9 +88,9 @@ def compute_savings_signals(
         return SavingsSignal(
             user_id=user_id,
             window_days=window_days,
-            savings_net_inflow=Decimal("0.00"),
-            savings_growth_rate_pct=Decimal("0.00"),
-            emergency_fund_months=Decimal("0.00")
+            savings_net_inflow=ZERO,
+            savings_growth_rate_pct=ZERO,
+            emergency_fund_months=ZERO
         )
 
     # Filter for savings accounts
@@ -96,9 +101,9 @@ def compute_savings_signals(
         return SavingsSignal(
             user_id=user_id,
             window_days=window_days,
-            savings_net_inflow=Decimal("0.00"),
-            savings_growth_rate_pct=Decimal("0.00"),
-            emergency_fund_months=Decimal("0.00")
+            savings_net_inflow=ZERO,
+            savings_growth_rate_pct=ZERO,
+            emergency_fund_months=ZERO
         )
 
     account_ids = [acc.account_id for acc in accounts]
@@ -116,22 +121,22 @@ def compute_savings_signals(
 
     # Calculate net inflow to savings
     # In Plaid-style data: credits (deposits) are negative, debits (withdrawals) are positive
-    credits = sum(abs(tx.amount) for tx in savings_txs if tx.amount < 0)
-    debits = sum(tx.amount for tx in savings_txs if tx.amount > 0)
+    credits = sum((abs(tx.amount) for tx in savings_txs if tx.amount < 0), ZERO)
+    debits = sum((tx.amount for tx in savings_txs if tx.amount > 0), ZERO)
     net_inflow = credits - debits
 
     # Calculate current savings balance
-    current_savings_balance = sum(acc.balance_current for acc in savings_accounts)
+    current_savings_balance = sum((acc.balance_current for acc in savings_accounts), ZERO)
 
     # Calculate growth rate
     # Past balance estimate = current balance - net inflow
     past_balance_estimate = current_savings_balance - net_inflow
 
     if past_balance_estimate > 0:
-        savings_growth_rate_pct = (Decimal(str(net_inflow)) / Decimal(str(past_balance_estimate))) * Decimal("100.0")
+        savings_growth_rate_pct = (net_inflow / past_balance_estimate) * HUNDRED
     else:
         # If past balance was zero or negative, can't calculate meaningful growth rate
-        savings_growth_rate_pct = Decimal("0.00")
+        savings_growth_rate_pct = ZERO
 
     # Calculate emergency fund coverage
     # Get checking account transactions for expense calculation
@@ -142,16 +147,16 @@ def compute_savings_signals(
     ]
 
     # Calculate average monthly expenses
-    months_in_window = Decimal(str(window_days)) / Decimal("30.0")
-    total_expenses = sum(tx.amount for tx in checking_txs)
-    avg_monthly_expenses = total_expenses / months_in_window if months_in_window > 0 else Decimal("0.00")
+    months_in_window = Decimal(window_days) / DAYS_PER_MONTH
+    total_expenses = sum((tx.amount for tx in checking_txs), ZERO)
+    avg_monthly_expenses = total_expenses / months_in_window if months_in_window > 0 else ZERO
 
     # Calculate emergency fund months
     if avg_monthly_expenses > 0:
         emergency_fund_months = current_savings_balance / avg_monthly_expenses
     else:
         # No expenses tracked means we can't calculate coverage
-        emergency_fund_months = Decimal("0.00")
+        emergency_fund_months = ZERO
 
     # Create signal model
     signal = SavingsSignal(
@@ -24,6 +24,11 @@ from spendsense.app.db.models import Account, SubscriptionSignal, Transaction
 
 logger = get_logger(__name__)
 
+# Decimal constants, built once instead of on every call
+ZERO = Decimal("0.00")
+HUNDRED = Decimal("100.0")
+DAYS_PER_MONTH = Decimal("30.0")
+
 
 def detect_recurring_merchants(
     transactions: list[Transaction],
@@ -140,8 +145,8 @@ def compute_subscription_signals(
             user_id=user_id,
             window_days=window_days,
             recurring_merchant_count=0,
-            monthly_recurring_spend=Decimal("0.00"),
-            subscription_share_pct=Decimal("0.00")
+            monthly_recurring_spend=ZERO,
+            subscription_share_pct=ZERO
         )
 
     account_ids = [acc.account_id for acc in accounts]
@@ -159,8 +164,8 @@ def compute_subscription_signals(
             user_id=user_id,
             window_days=window_days,
             recurring_merchant_count=0,
-            monthly_recurring_spend=Decimal("0.00"),
-            subscription_share_pct=Decimal("0.00")
+            monthly_recurring_spend=ZERO,
+            subscription_share_pct=ZERO
         )
 
     # Detect recurring merchants
@@ -171,20 +176,20 @@ def compute_subscription_signals(
         tx for tx in transactions
         if tx.category == "Subscription" and tx.amount > 0
     ]
-    subscription_total = sum(tx.amount for tx in subscription_txs)
+    subscription_total = sum((tx.amount for tx in subscription_txs), ZERO)
 
     # Calculate monthly recurring spend
-    months_in_window = Decimal(str(window_days)) / Decimal("30.0")
-    monthly_recurring_spend = subscription_total / months_in_window if months_in_window > 0 else Decimal("0.00")
+    months_in_window = Decimal(window_days) / DAYS_PER_MONTH
+    monthly_recurring_spend = subscription_total / months_in_window if months_in_window > 0 else ZERO
 
     # Calculate total debit spend (for subscription share calculation)
-    total_debit = sum(abs(tx.amount) for tx in transactions if tx.amount > 0)
+    total_debit = sum((abs(tx.amount) for tx in transactions if tx.amount > 0), ZERO)
 
     # Calculate subscription share percentage
     if total_debit > 0:
-        subscription_share_pct = (Decimal(str(subscription_total)) / Decimal(str(total_debit))) * Decimal("100.0")
+        subscription_share_pct = (subscription_total / total_debit) * HUNDRED
     else:
-        subscription_share_pct = Decimal("0.00")
+        subscription_share_pct = ZERO
 
     # Create signal model
     signal = SubscriptionSignal(
@@ -14,11 +14,12 @@ Why this exists:
 """
 
 import uuid
-from datetime import datetime
 
 from fastapi import Depends, HTTPException, status
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from spendsense.app.core.clock import utcnow
 from spendsense.app.core.logging import get_logger
 from spendsense.app.db.models import ConsentEvent, User
 from spendsense.app.db.session import get_db
@@ -83,7 +84,7 @@ def record_consent(
         action=action,
         reason=reason,
         consent_given_by=by,
-        timestamp=datetime.utcnow(),
+        timestamp=utcnow(),
     )
 
     session.add(consent_event)
@@ -128,25 +129,26 @@ def check_consent(user_id: str, session: Session) -> bool:
         else:
             # Block with 403
     """
-    # Get most recent consent event
-    latest_event = (
-        session.query(ConsentEvent)
-        .filter(ConsentEvent.user_id == user_id)
+    # Get most recent consent action (an idx_consent_user_timestamp seek);
+    # only the action column is selected, so no ORM object is built
+    latest_action = session.scalar(
+        select(ConsentEvent.action)
+        .where(ConsentEvent.user_id == user_id)
         .order_by(ConsentEvent.timestamp.desc())
-        .first()
+        .limit(1)
     )
 
-    if not latest_event:
+    if latest_action is None:
         logger.debug("no_consent_found", user_id=user_id)
         return False
 
-    has_consent = latest_event.action == "opt_in"
+    has_consent = latest_action == "opt_in"
 
     logger.debug(
         "consent_checked",
         user_id=user_id,
         has_consent=has_consent,
-        latest_action=latest_event.action,
+        latest_action=latest_action,
     )
 
     return has_consent
@@ -174,20 +176,20 @@ def get_consent_status(user_id: str, session: Session) -> dict:
         #     "event_count": 2
         # }
     """
-    latest_event = (
-        session.query(ConsentEvent)
+    # Latest event and total count in one round trip: the window count is
+    # computed over all of the user's events before LIMIT 1 applies
+    latest = (
+        session.query(
+            ConsentEvent.action,
+            ConsentEvent.timestamp,
+            func.count().over().label("event_count"),
+        )
         .filter(ConsentEvent.user_id == user_id)
         .order_by(ConsentEvent.timestamp.desc())
         .first()
     )
 
-    event_count = (
-        session.query(ConsentEvent)
-        .filter(ConsentEvent.user_id == user_id)
-        .count()
-    )
-
-    if not latest_event:
+    if latest is None:
         return {
             "has_consent": False,
             "latest_action": None,
@@ -196,10 +198,10 @@ def get_consent_status(user_id: str, session: Session) -> dict:
         }
 
     return {
-        "has_consent": latest_event.action == "opt_in",
-        "latest_action": latest_event.action,
-        "latest_timestamp": latest_event.timestamp.isoformat(),
-        "event_count": event_count,
+        "has_consent": latest.action == "opt_in",
+        "latest_action": latest.action,
+        "latest_timestamp": latest.timestamp.isoformat(),
+        "event_count": latest.event_count,
     }
 
 
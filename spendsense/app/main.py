@@ -261,3 +261,19 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         },
     )
 
+
+if __name__ == "__main__":
+    # Run directly with `python -m spendsense.app.main`.
+    # Prefer uvloop + httptools over the asyncio selector loop and the
+    # pure-Python h11 parser; uvloop has no Windows build, so fall back there.
+    import importlib.util
+
+    import uvicorn
+
+    uvicorn.run(
+        "spendsense.app.main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools",
+    )
@@ -12,10 +12,12 @@ Why this exists:
 """
 
 import json
-from datetime import datetime
+from typing import Any
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from spendsense.app.core.clock import utcnow
 from spendsense.app.core.logging import get_logger
 from spendsense.app.db.models import (
     CreditSignal,
@@ -30,6 +32,122 @@ from spendsense.app.schemas.persona import PersonaAssignment
 logger = get_logger(__name__)
 
 
+SignalRow = SubscriptionSignal | SavingsSignal | CreditSignal | IncomeSignal
+
+SIGNAL_MODELS: dict[str, type[SignalRow]] = {
+    "subscription": SubscriptionSignal,
+    "savings": SavingsSignal,
+    "credit": CreditSignal,
+    "income": IncomeSignal,
+}
+
+
+def fetch_all_signals(
+    user_id: str,
+    session: Session,
+    windows: tuple[int, ...] = (30, 180),
+) -> dict[int, dict[str, Any]]:
+    """
+    Fetch all 4 signal types for a user across several time windows at once.
+    
+    Runs one query per signal type with `window_days IN (...)` instead of one
+    query per (signal type, window) pair, then groups the rows by window in Python.
+    
+    Why this exists:
+    - Profile and pipeline code usually need both the 30d and 180d windows
+    - 4 round trips instead of 8 when both windows are needed
+    
+    Args:
+        user_id: User identifier
+        session: SQLAlchemy database session
+        windows: Time windows to fetch (default both 30 and 180)
+    
+    Returns:
+        Dict keyed by window_days, each mapping signal name
+        ("subscription", "savings", "credit", "income") to the row or None
+    
+    Example:
+        signals = fetch_all_signals("user_123", session)
+        signals[30]["credit"]  # CreditSignal for the 30-day window (or None)
+    """
+    grouped: dict[int, dict[str, Any]] = {
+        window: dict.fromkeys(SIGNAL_MODELS) for window in windows
+    }
+
+    for name, model in SIGNAL_MODELS.items():
+        rows = session.execute(select(model.window_days, model).where(
+            model.user_id == user_id,
+            model.window_days.in_(windows),
+        ))
+        for window_days, row in rows:
+            grouped[window_days][name] = row
+
+    return grouped
+
+
+def evaluate_persona(
+    signals: dict[str, Any],
+    window_days: int,
+    user_id: str | None = None,
+) -> tuple[str, dict[str, Any]]:
+    """
+    Pick the persona for one window's signals without touching the database.
+    
+    Checks persona rules in priority order (High Utilization first); the first
+    matching persona wins. Falls back to "insufficient_data" when there are no
+    signals or no persona criteria are met.
+    
+    Args:
+        signals: Signal rows keyed by name, as returned per window by fetch_all_signals
+        window_days: Time window in days (used in the fallback criteria)
+        user_id: User identifier, only used for logging
+    
+    Returns:
+        Tuple of (persona_id, criteria_met)
+    """
+    if not any(signals.values()):
+        # No data available, assign "insufficient_data" persona
+        logger.warning(
+            "insufficient_data_for_persona",
+            user_id=user_id,
+            window_days=window_days,
+        )
+        return "insufficient_data", {
+            "reason": "No behavioral signals available for this time window",
+            "window_days": window_days,
+        }
+
+    # Check personas in priority order
+    for persona_id, check_func in PERSONA_CHECKS:
+        matches, criteria = check_func(
+            credit=signals["credit"],
+            subscription=signals["subscription"],
+            savings=signals["savings"],
+            income=signals["income"],
+        )
+
+        if matches:
+            logger.info(
+                "persona_matched",
+                user_id=user_id,
+                window_days=window_days,
+                persona_id=persona_id,
+                matched_on=criteria.get("matched_on", []),
+            )
+            return persona_id, criteria  # First match wins
+
+    # If no persona matched, assign "insufficient_data"
+    logger.warning(
+        "no_persona_matched",
+        user_id=user_id,
+        window_days=window_days,
+    )
+    return "insufficient_data", {
+        "reason": "Signals present but no persona criteria met",
+        "window_days": window_days,
+    }
+
+
 def assign_persona(
     user_id: str,
     window_days: int,
@@ -64,144 +182,99 @@ def assign_persona(
         # persona.persona_id = "high_utilization"
         # persona.criteria_met = {"credit_utilization_max_pct": 68.5, ...}
     """
+    return assign_personas(user_id, session, windows=(window_days,))[window_days]
+
+
+def assign_personas(
+    user_id: str,
+    session: Session,
+    windows: tuple[int, ...] = (30, 180),
+) -> dict[int, PersonaAssignment]:
+    """
+    Assign personas for several time windows in one pass.
+    
+    Signals for every window are fetched together (see fetch_all_signals),
+    the rules run in memory per window, and all persona rows are written
+    with a single commit.
+    
+    Args:
+        user_id: User identifier
+        session: SQLAlchemy database session
+        windows: Time windows to assign (default both 30 and 180)
+    
+    Returns:
+        Dict mapping window_days to its PersonaAssignment
+    
+    Example:
+        personas = assign_personas("user_123", session)
+        # personas[30].persona_id = "high_utilization"
+        # personas[180].persona_id = "subscription_heavy"
+    """
     logger.info(
         "assigning_persona",
         user_id=user_id,
-        window_days=window_days,
+        windows=list(windows),
     )
 
-    # Fetch all signals for this user and window
-    subscription_signal = session.query(SubscriptionSignal).filter(
-        SubscriptionSignal.user_id == user_id,
-        SubscriptionSignal.window_days == window_days,
-    ).first()
-
-    savings_signal = session.query(SavingsSignal).filter(
-        SavingsSignal.user_id == user_id,
-        SavingsSignal.window_days == window_days,
-    ).first()
-
-    credit_signal = session.query(CreditSignal).filter(
-        CreditSignal.user_id == user_id,
-        CreditSignal.window_days == window_days,
-    ).first()
-
-    income_signal = session.query(IncomeSignal).filter(
-        IncomeSignal.user_id == user_id,
-        IncomeSignal.window_days == window_days,
-    ).first()
+    signals_by_window = fetch_all_signals(user_id, session, windows)
 
-    logger.debug(
-        "signals_fetched",
-        user_id=user_id,
-        window_days=window_days,
-        has_subscription=subscription_signal is not None,
-        has_savings=savings_signal is not None,
-        has_credit=credit_signal is not None,
-        has_income=income_signal is not None,
-    )
+    # Existing persona rows for these windows (one query for all windows)
+    existing_personas: dict[int, Persona] = {}
+    for existing in session.query(Persona).filter(
+        Persona.user_id == user_id,
+        Persona.window_days.in_(windows),
+    ).all():
+        existing_personas.setdefault(existing.window_days, existing)
 
-    # Check if we have any signals at all
-    has_any_signals = any([
-        subscription_signal,
-        savings_signal,
-        credit_signal,
-        income_signal,
-    ])
+    personas: dict[int, Persona] = {}
+    for window_days in windows:
+        signals = signals_by_window[window_days]
 
-    if not has_any_signals:
-        # No data available, assign "insufficient_data" persona
-        logger.warning(
-            "insufficient_data_for_persona",
+        logger.debug(
+            "signals_fetched",
             user_id=user_id,
             window_days=window_days,
+            has_subscription=signals["subscription"] is not None,
+            has_savings=signals["savings"] is not None,
+            has_credit=signals["credit"] is not None,
+            has_income=signals["income"] is not None,
         )
-        assigned_persona_id = "insufficient_data"
-        criteria_met = {
-            "reason": "No behavioral signals available for this time window",
-            "window_days": window_days,
-        }
-    else:
-        # Check personas in priority order
-        assigned_persona_id = None
-        criteria_met = {}
-
-        for persona_id, check_func in PERSONA_CHECKS:
-            matches, criteria = check_func(
-                credit=credit_signal,
-                subscription=subscription_signal,
-                savings=savings_signal,
-                income=income_signal,
-            )
 
-            if matches:
-                assigned_persona_id = persona_id
-                criteria_met = criteria
-                logger.info(
-                    "persona_matched",
-                    user_id=user_id,
-                    window_days=window_days,
-                    persona_id=persona_id,
-                    matched_on=criteria.get("matched_on", []),
-                )
-                break  # First match wins
-
-        # If no persona matched, assign "insufficient_data"
-        if not assigned_persona_id:
-            logger.warning(
-                "no_persona_matched",
+        assigned_persona_id, criteria_met = evaluate_persona(signals, window_days, user_id)
+
+        persona: Persona | None = existing_personas.get(window_days)
+        if persona:
+            # Update existing persona
+            persona.persona_id = assigned_persona_id
+            persona.criteria_met = json.dumps(criteria_met)
+            persona.assigned_at = utcnow()
+            event = "persona_updated"
+        else:
+            # Create new persona
+            persona = Persona(
                 user_id=user_id,
+                persona_id=assigned_persona_id,
                 window_days=window_days,
+                criteria_met=json.dumps(criteria_met),
+                assigned_at=utcnow(),
             )
-            assigned_persona_id = "insufficient_data"
-            criteria_met = {
-                "reason": "Signals present but no persona criteria met",
-                "window_days": window_days,
-            }
-
-    # Check if persona already exists for this user and window
-    existing_persona = session.query(Persona).filter(
-        Persona.user_id == user_id,
-        Persona.window_days == window_days,
-    ).first()
-
-    if existing_persona:
-        # Update existing persona
-        existing_persona.persona_id = str(assigned_persona_id) if assigned_persona_id else "insufficient_data"
-        existing_persona.criteria_met = json.dumps(criteria_met)
-        existing_persona.assigned_at = datetime.utcnow()
-        session.commit()
-        session.refresh(existing_persona)
+            session.add(persona)
+            event = "persona_created"
 
+        personas[window_days] = persona
         logger.info(
-            "persona_updated",
+            event,
             user_id=user_id,
             window_days=window_days,
             persona_id=assigned_persona_id,
         )
 
-        return PersonaAssignment.model_validate(existing_persona)
-    else:
-        # Create new persona
-        new_persona = Persona(
-            user_id=user_id,
-            persona_id=assigned_persona_id,
-            window_days=window_days,
-            criteria_met=json.dumps(criteria_met),
-            assigned_at=datetime.utcnow(),
-        )
-        session.add(new_persona)
-        session.commit()
-        session.refresh(new_persona)
-
-        logger.info(
-            "persona_created",
-            user_id=user_id,
-            window_days=window_days,
-            persona_id=assigned_persona_id,
-        )
+    session.commit()
 
-        return PersonaAssignment.model_validate(new_persona)
+    return {
+        window_days: PersonaAssignment.from_orm_trusted(persona)
+        for window_days, persona in personas.items()
+    }
 
 
 def get_persona(
@@ -228,7 +301,7 @@ def get_persona(
     ).first()
 
     if persona:
-        return PersonaAssignment.model_validate(persona)
+        return PersonaAssignment.from_orm_trusted(persona)
     return None
 
 
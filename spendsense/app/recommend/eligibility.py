@@ -11,7 +11,7 @@ Why this exists:
 - Provides clear reasons when offers are filtered out
 """
 
-from decimal import Decimal
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from spendsense.app.core.logging import get_logger
@@ -20,12 +20,12 @@ logger = get_logger(__name__)
 
 
 # Predatory product types that are always blocked
-BLOCKED_PRODUCT_TYPES = [
+BLOCKED_PRODUCT_TYPES = frozenset({
     "payday_loan",
     "title_loan",
     "pawn_loan",
     "rent_to_own",
-]
+})
 
 
 def check_eligibility(
@@ -37,11 +37,10 @@ def check_eligibility(
     Check if a user is eligible for a partner offer.
     
     How it works:
-    1. Check for predatory product types (always blocked)
-    2. Check minimum income requirements if specified
-    3. Check credit utilization thresholds
-    4. Check other criteria from eligibility_criteria field
-    5. Return eligible/not eligible with reason
+    1. Check for existing savings accounts and predatory product types
+    2. Check boolean and integer criteria (overdue, credit score, age)
+    3. Check numeric thresholds (utilization, monthly bills)
+    4. Return eligible/not eligible with reason at the first failed check
     
     Why we need this:
     - Shows only relevant offers
@@ -97,6 +96,18 @@ def check_eligibility(
     if not eligibility_criteria:
         return True, "No eligibility restrictions"
 
+    # Criteria run cheapest first (boolean flags, then numeric compares) so
+    # most rejections happen before any threshold math. Thresholds compare as
+    # float: these are eligibility cut-offs, not money we store.
+
+    # Check not overdue requirement
+    if eligibility_criteria.get("not_overdue", False):
+        credit_data = signals.get("credit", {})
+        is_overdue = credit_data.get("is_overdue", False)
+
+        if is_overdue:
+            return False, "Cannot have overdue payments"
+
     # Check minimum credit score
     if "min_credit_score" in eligibility_criteria:
         min_score = eligibility_criteria["min_credit_score"]
@@ -114,23 +125,6 @@ def check_eligibility(
         if user_score < min_score:
             return False, f"Requires credit score ≥{min_score}"
 
-    # Check maximum utilization
-    if "max_utilization" in eligibility_criteria:
-        max_util = Decimal(str(eligibility_criteria["max_utilization"]))
-        credit_data = signals.get("credit", {})
-        current_util = credit_data.get("credit_utilization_max_pct", Decimal("0"))
-
-        if current_util > max_util:
-            return False, f"Credit utilization too high (maximum {max_util}%)"
-
-    # Check not overdue requirement
-    if eligibility_criteria.get("not_overdue", False):
-        credit_data = signals.get("credit", {})
-        is_overdue = credit_data.get("is_overdue", False)
-
-        if is_overdue:
-            return False, "Cannot have overdue payments"
-
     # Check minimum age
     if "min_age" in eligibility_criteria:
         min_age = eligibility_criteria["min_age"]
@@ -143,13 +137,24 @@ def check_eligibility(
         if user_age < min_age:
             return False, f"Requires age ≥{min_age}"
 
+    # Check maximum utilization
+    if "max_utilization" in eligibility_criteria:
+        max_util = eligibility_criteria["max_utilization"]
+        current_util = signals.get("credit", {}).get("credit_utilization_max_pct")
+
+        # No utilization data counts as 0%, which is under any maximum
+        if current_util is not None and float(current_util) > float(max_util):
+            return False, f"Credit utilization too high (maximum {max_util}%)"
+
     # Check minimum monthly bills (for bill negotiation services)
     if "min_monthly_bills" in eligibility_criteria:
-        min_bills = Decimal(str(eligibility_criteria["min_monthly_bills"]))
-        subscription_data = signals.get("subscription", {})
-        monthly_recurring = subscription_data.get("monthly_recurring_spend", Decimal("0"))
+        min_bills = eligibility_criteria["min_monthly_bills"]
+        monthly_recurring = signals.get("subscription", {}).get("monthly_recurring_spend")
+
+        # No subscription data counts as $0/month
+        current_bills = 0.0 if monthly_recurring is None else float(monthly_recurring)
 
-        if monthly_recurring < min_bills:
+        if current_bills < float(min_bills):
             return False, f"Requires at least ${min_bills}/month in recurring bills"
 
     # All checks passed
@@ -195,3 +200,39 @@ def validate_offer_safety(item: dict[str, Any]) -> bool:
     return True
 
 
+def iter_eligible_offers(
+    offers: Iterable[dict[str, Any]],
+    signals: dict[str, Any],
+    user_data: dict[str, Any] | None = None,
+) -> Iterator[tuple[dict[str, Any], str]]:
+    """
+    Lazily run safety and eligibility checks over a batch of offers.
+    
+    Yields each surviving offer as soon as it passes, so the caller can build
+    its rationale in the same pass instead of collecting a list first.
+    
+    Args:
+        offers: Candidate offer dicts from content_catalog.json
+        signals: Dict with all 4 signal types (credit, income, savings, subscription)
+        user_data: Optional additional user data (age, has_savings_account, etc.)
+    
+    Yields:
+        (offer, eligibility_reason) for safe, eligible offers, in input order
+    """
+    for item in offers:
+        # Safety check
+        if not validate_offer_safety(item):
+            logger.warning("offer_blocked_unsafe", item_id=item.get("id"))
+            continue
+
+        # Eligibility check
+        eligible, reason = check_eligibility(item, signals, user_data)
+        if not eligible:
+            logger.debug(
+                "offer_filtered_ineligible",
+                item_id=item.get("id"),
+                reason=reason,
+            )
+            continue
+
+        yield item, reason
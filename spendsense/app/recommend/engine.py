@@ -12,12 +12,16 @@ Why this exists:
 """
 
 import json
-from decimal import Decimal
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from sqlalchemy.orm import Query, Session
 
+from spendsense.app.core import json_utils
 from spendsense.app.core.logging import get_logger
 from spendsense.app.db.models import (
     Account,
@@ -29,36 +33,116 @@ from spendsense.app.db.models import (
     SubscriptionSignal,
 )
 from spendsense.app.recommend.disclosure import add_disclosure
-from spendsense.app.recommend.eligibility import check_eligibility, validate_offer_safety
+from spendsense.app.recommend.eligibility import iter_eligible_offers
 from spendsense.app.recommend.tone import check_tone
 from spendsense.app.schemas.recommendation import RecommendationItem
 
 logger = get_logger(__name__)
 
 
-def load_content_catalog() -> dict[str, list[dict[str, Any]]]:
+CATALOG_PATH = Path(__file__).parent / "content_catalog.json"
+
+
+def index_by_tag(items: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """
+    Build an inverted index from tag to the catalog items carrying it.
+    
+    Items keep their catalog order within each tag, so picking the first N
+    candidates for a persona gives the same result as filtering the full list.
+    """
+    index: dict[str, list[dict[str, Any]]] = {}
+    for item in items:
+        for tag in dict.fromkeys(item.get("tags", [])):  # de-dupe, keep order
+            index.setdefault(tag, []).append(item)
+    return index
+
+
+@lru_cache(maxsize=1)
+def _read_content_catalog(mtime: float) -> dict[str, Any]:
+    """
+    Parse the catalog file once per modification time.
+    
+    The mtime argument is only the cache key: editing content_catalog.json
+    changes it, so the next call re-reads the file instead of serving a stale copy.
+    Uses orjson when installed (several times faster than stdlib json).
+    """
+    catalog: dict[str, Any] = json_utils.loads(CATALOG_PATH.read_bytes())
+    catalog["education_by_tag"] = index_by_tag(catalog.get("education_items", []))
+    catalog["offers_by_tag"] = index_by_tag(catalog.get("partner_offers", []))
+    logger.debug("content_catalog_loaded", item_count=len(catalog.get("education_items", [])) + len(catalog.get("partner_offers", [])))
+    return catalog
+
+
+def load_content_catalog() -> dict[str, Any]:
     """
     Load the content catalog JSON file.
     
+    The parsed catalog is cached per process (see _read_content_catalog), so
+    callers share one dict and must treat it as read-only.
+    
     Returns:
-        Dict with 'education_items' and 'partner_offers' lists
+        Dict with 'education_items' and 'partner_offers' lists,
+        'rationale_templates' (persona_id -> template), plus
+        'education_by_tag' and 'offers_by_tag' indexes (tag -> items)
     """
-    catalog_path = Path(__file__).parent / "content_catalog.json"
-
     try:
-        with open(catalog_path) as f:
-            catalog: dict[str, list[dict[str, Any]]] = json.load(f)
-        logger.debug("content_catalog_loaded", item_count=len(catalog.get("education_items", [])) + len(catalog.get("partner_offers", [])))
-        return catalog
+        return _read_content_catalog(CATALOG_PATH.stat().st_mtime)
     except Exception as e:
         logger.error("failed_to_load_catalog", error=str(e))
-        return {"education_items": [], "partner_offers": []}
+        return {
+            "education_items": [],
+            "partner_offers": [],
+            "rationale_templates": {},
+            "education_by_tag": {},
+            "offers_by_tag": {},
+        }
+
+
+class _SafeDict(dict[str, Any]):
+    """format_map context that renders unknown placeholders as empty strings."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+def _rationale_context(signals: dict[str, Any]) -> _SafeDict:
+    """
+    Collect every value the rationale templates can reference.
+    
+    Optional sentences (e.g. "You have overdue payments. ") are pre-rendered
+    as *_clause values so the templates themselves stay branch-free.
+    """
+    credit = signals.get("credit", {})
+    income = signals.get("income", {})
+    subscription = signals.get("subscription", {})
+    savings = signals.get("savings", {})
+
+    max_util = credit.get("credit_utilization_max_pct", 0)
+    growth = savings.get("savings_growth_rate_pct", 0)
+    inflow = savings.get("savings_net_inflow", 0)
+
+    return _SafeDict(
+        utilization_clause=f"Your credit utilization is {max_util:.2f}%. " if max_util > 0 else "",
+        interest_clause="You're paying interest charges. " if credit.get("has_interest_charges", False) else "",
+        overdue_clause="You have overdue payments. " if credit.get("is_overdue", False) else "",
+        median_pay_gap_days=income.get("median_pay_gap_days", 0),
+        cashflow_buffer_months=income.get("cashflow_buffer_months", 0),
+        recurring_merchant_count=subscription.get("recurring_merchant_count", 0),
+        monthly_recurring_spend=subscription.get("monthly_recurring_spend", 0),
+        growth_clause=f"Your savings grew {growth:.2f}% this period. " if growth > 0 else "",
+        inflow_clause=f"with ${inflow:.2f}/month in new deposits. " if inflow > 0 else "",
+    )
+
+
+# Used when the catalog (and its templates) failed to load
+DEFAULT_RATIONALE_TEMPLATE = "Based on your financial profile. this resource might be helpful."
 
 
 def build_rationale(
     item: dict[str, Any],
     persona_id: str,
     signals: dict[str, Any],
+    templates: dict[str, str] | None = None,
 ) -> str:
     """
     Build a plain-language rationale citing concrete signal data.
@@ -66,10 +150,15 @@ def build_rationale(
     This is the heart of explainability - we tell users WHY they're seeing
     this recommendation using their actual transaction data.
     
+    The wording lives in content_catalog.json under "rationale_templates"
+    (keyed by persona_id, with a "default" entry); this function only fills
+    in the numbers.
+    
     Args:
         item: The content item from catalog
         persona_id: The user's assigned persona
         signals: Dict with all signal data
+        templates: Rationale templates by persona_id (defaults to the catalog's)
     
     Returns:
         Plain-language rationale string
@@ -78,67 +167,296 @@ def build_rationale(
         "Your utilization is 68% on card ending in 4523. Consider paying more 
         than the minimum to reduce interest charges and improve your credit score."
     """
-    rationale_parts = []
+    if templates is None:
+        templates = load_content_catalog().get("rationale_templates", {})
+
+    template = templates.get(persona_id) or templates.get("default", DEFAULT_RATIONALE_TEMPLATE)
+    return template.format_map(_rationale_context(signals))
+
+
+def _subscription_data(signal: SubscriptionSignal) -> dict[str, Any]:
+    return {
+        "recurring_merchant_count": signal.recurring_merchant_count,
+        "monthly_recurring_spend": float(signal.monthly_recurring_spend),
+    }
+
+
+def _savings_data(signal: SavingsSignal) -> dict[str, Any]:
+    return {
+        "savings_net_inflow": float(signal.savings_net_inflow),
+        "savings_growth_rate_pct": float(signal.savings_growth_rate_pct),
+    }
+
+
+def _credit_data(signal: CreditSignal) -> dict[str, Any]:
+    return {
+        "credit_utilization_max_pct": float(signal.credit_utilization_max_pct),
+        "has_interest_charges": signal.has_interest_charges,
+        "is_overdue": signal.is_overdue,
+    }
+
+
+def _income_data(signal: IncomeSignal) -> dict[str, Any]:
+    return {
+        "median_pay_gap_days": float(signal.median_pay_gap_days),
+        "cashflow_buffer_months": float(signal.cashflow_buffer_months),
+    }
+
+
+# Signal name -> function turning the ORM row into the dict build_rationale
+# and check_eligibility read. Each dict carries only the fields those two
+# read (see _rationale_context and CRITERIA_SIGNALS), so nothing else is
+# copied off the ORM row. Numeric columns are converted to float once
+# here: these values only feed threshold compares and display text, and
+# float math is far cheaper than Decimal. Money stays Decimal in the DB.
+SIGNAL_BUILDERS: dict[str, Callable[[Any], dict[str, Any]]] = {
+    "subscription": _subscription_data,
+    "savings": _savings_data,
+    "credit": _credit_data,
+    "income": _income_data,
+}
+
+# Signals each persona's rationale cites (see build_rationale)
+PERSONA_SIGNALS: dict[str, tuple[str, ...]] = {
+    "high_utilization": ("credit",),
+    "variable_income_budgeter": ("income",),
+    "subscription_heavy": ("subscription",),
+    "savings_builder": ("savings",),
+    "cash_flow_optimizer": ("income",),
+}
+
+# Signals each eligibility criterion reads (see check_eligibility)
+CRITERIA_SIGNALS: dict[str, str] = {
+    "max_utilization": "credit",
+    "not_overdue": "credit",
+    "min_monthly_bills": "subscription",
+}
+
+
+def _signals_needed(persona_id: str, offers: list[dict[str, Any]]) -> set[str]:
+    """Signal names the rationale for this persona plus the given offers' criteria depend on."""
+    needed = set(PERSONA_SIGNALS.get(persona_id, ()))
+    for item in offers:
+        for criterion in item.get("eligibility_criteria", {}):
+            if criterion in CRITERIA_SIGNALS:
+                needed.add(CRITERIA_SIGNALS[criterion])
+    return needed
+
+
+UserContext = tuple[Persona, SubscriptionSignal | None, SavingsSignal | None, CreditSignal | None, IncomeSignal | None]
+
+
+def _user_context_query(session: Session, window_days: int) -> Query[Any]:
+    """
+    Query persona rows for a window with all 4 signals LEFT OUTER JOINed on.
+    
+    Signals are joined on (user_id, window_days), so a missing signal comes
+    back as None. Each signal table has a unique (user_id, window_days) index,
+    so the join never multiplies rows.
+    """
+    return (
+        session.query(Persona, SubscriptionSignal, SavingsSignal, CreditSignal, IncomeSignal)
+        .outerjoin(
+            SubscriptionSignal,
+            and_(
+                SubscriptionSignal.user_id == Persona.user_id,
+                SubscriptionSignal.window_days == Persona.window_days,
+            ),
+        )
+        .outerjoin(
+            SavingsSignal,
+            and_(
+                SavingsSignal.user_id == Persona.user_id,
+                SavingsSignal.window_days == Persona.window_days,
+            ),
+        )
+        .outerjoin(
+            CreditSignal,
+            and_(
+                CreditSignal.user_id == Persona.user_id,
+                CreditSignal.window_days == Persona.window_days,
+            ),
+        )
+        .outerjoin(
+            IncomeSignal,
+            and_(
+                IncomeSignal.user_id == Persona.user_id,
+                IncomeSignal.window_days == Persona.window_days,
+            ),
+        )
+        .filter(Persona.window_days == window_days)
+    )
+
+
+def _load_user_context(
+    session: Session,
+    user_id: str,
+    window_days: int,
+) -> UserContext | None:
+    """
+    Load the persona and all 4 signals for a user+window in a single query.
+    
+    Returns:
+        Tuple of (persona, subscription, savings, credit, income), or None
+        if no persona has been assigned for this window
+    """
+    row = _user_context_query(session, window_days).filter(Persona.user_id == user_id).first()
+
+    if row is None:
+        return None
+    return row[0], row[1], row[2], row[3], row[4]
+
 
-    # Persona-specific rationale builders
-    if persona_id == "high_utilization":
-        credit = signals.get("credit", {})
-        max_util = credit.get("credit_utilization_max_pct", 0)
-        has_interest = credit.get("has_interest_charges", False)
-        is_overdue = credit.get("is_overdue", False)
+def _load_user_data(session: Session, user_ids: list[str]) -> dict[str, dict[str, Any]]:
+    """
+    Load the account facts offer eligibility needs, for many users in one query.
+    
+    Returns:
+        Dict of user_id -> user_data for check_eligibility (e.g. has_savings_account)
+    """
+    savings_owners = {
+        user_id
+        for (user_id,) in session.query(Account.user_id)
+        .filter(
+            Account.user_id.in_(user_ids),
+            Account.holder_category == "individual",
+            Account.account_subtype == "savings",
+        )
+        .distinct()
+    }
+    return {user_id: {"has_savings_account": user_id in savings_owners} for user_id in user_ids}
 
-        if max_util > 0:
-            rationale_parts.append(f"Your credit utilization is {max_util}%")
-        if has_interest:
-            rationale_parts.append("You're paying interest charges")
-        if is_overdue:
-            rationale_parts.append("You have overdue payments")
 
-        rationale_parts.append("Consider this resource to help reduce your credit burden")
+def _delete_existing_recommendations(session: Session, user_ids: list[str], window_days: int) -> None:
+    """Delete stored recommendations for these users+window so regeneration doesn't duplicate them."""
+    existing_recs = session.query(Recommendation).filter(
+        Recommendation.user_id.in_(user_ids),
+        Recommendation.window_days == window_days,
+    ).all()
+
+    if existing_recs:
+        logger.info("deleting_existing_recommendations", user_count=len(user_ids), window_days=window_days, count=len(existing_recs))
+        for rec in existing_recs:
+            session.delete(rec)
+        session.flush()
+
+
+def _iter_survivors(
+    candidates: Iterable[tuple[dict[str, Any], str, str | None]],
+    persona_id: str,
+    signals: dict[str, Any],
+    rationale_templates: dict[str, str],
+) -> Iterator[dict[str, Any]]:
+    """
+    Turn candidate items into Recommendation fields in a single pass.
+    
+    Checks run cheapest first: duplicate title, then rationale + tone check,
+    then disclosure. candidates are (item, item_type, eligibility_reason)
+    tuples; the reason is None for education items, which have no
+    eligibility criteria.
+    
+    Yields:
+        Dict of item-specific Recommendation kwargs (item_type, title,
+        rationale, eligibility_flags, disclosure)
+    """
+    seen_titles: set[str] = set()  # Track titles to avoid duplicates within same generation
+
+    for item, item_type, eligibility_reason in candidates:
+        # Skip if we've already added this title
+        if item["title"] in seen_titles:
+            logger.debug("skipping_duplicate_title", title=item["title"])
+            continue
 
-    elif persona_id == "variable_income_budgeter":
-        income = signals.get("income", {})
-        pay_gap = income.get("median_pay_gap_days", 0)
-        buffer = income.get("cashflow_buffer_months", 0)
+        rationale = build_rationale(item, persona_id, signals, rationale_templates)
 
-        rationale_parts.append(f"Your paychecks arrive every {pay_gap} days on average")
-        rationale_parts.append(f"with a {buffer:.1f} month cash-flow buffer")
-        rationale_parts.append("This resource might help you manage irregular income")
+        # Tone check
+        tone_passed, tone_issues = check_tone(rationale)
+        if not tone_passed:
+            logger.warning(
+                "rationale_tone_failed",
+                item_id=item["id"],
+                issues=tone_issues,
+            )
+            continue  # Skip this item
 
-    elif persona_id == "subscription_heavy":
-        subscription = signals.get("subscription", {})
-        merchant_count = subscription.get("recurring_merchant_count", 0)
-        monthly_spend = subscription.get("monthly_recurring_spend", 0)
+        if eligibility_reason is None:
+            flags: dict[str, Any] = {"tone_check": "passed"}
+        else:
+            flags = {"eligible": True, "reason": eligibility_reason, "tone_check": "passed"}
 
-        rationale_parts.append(f"You have {merchant_count} recurring subscriptions")
-        rationale_parts.append(f"totaling about ${monthly_spend}/month")
-        rationale_parts.append("Consider this resource to help optimize your subscriptions")
+        seen_titles.add(item["title"])  # Mark this title as seen
+        yield {
+            "item_type": item_type,
+            "title": item["title"],
+            "rationale": rationale,
+            "eligibility_flags": json.dumps(flags),
+            "disclosure": add_disclosure(item)["disclosure"],
+        }
 
-    elif persona_id == "savings_builder":
-        savings = signals.get("savings", {})
-        growth = savings.get("savings_growth_rate_pct", 0)
-        inflow = savings.get("savings_net_inflow", 0)
 
-        if growth > 0:
-            rationale_parts.append(f"Your savings grew {growth}% this period")
-        if inflow > 0:
-            rationale_parts.append(f"with ${inflow:.2f}/month in new deposits")
-        rationale_parts.append("This resource could help you optimize your savings strategy")
+def _build_recommendations(
+    user_id: str,
+    window_days: int,
+    context: UserContext,
+    catalog: dict[str, Any],
+    user_data: dict[str, Any],
+) -> list[Recommendation]:
+    """
+    Build (unsaved) Recommendation rows for one user from preloaded data.
+    
+    Pure in-memory work - no queries - so the single-user and batch paths
+    share it and only differ in how they load context and user_data.
+    """
+    persona, subscription_signal, savings_signal, credit_signal, income_signal = context
+    persona_id = persona.persona_id
 
-    elif persona_id == "cash_flow_optimizer":
-        income = signals.get("income", {})
-        buffer = income.get("cashflow_buffer_months", 0)
+    # Look up items by persona tag (precomputed when the catalog is loaded)
+    education_candidates = catalog["education_by_tag"].get(persona_id, [])
+    offer_candidates = catalog["offers_by_tag"].get(persona_id, [])
+    rationale_templates = catalog.get("rationale_templates", {})
+
+    # Build signals dict for eligibility and rationale, only for the signals
+    # this persona's rationale and candidate offers actually read
+    loaded_signals = {
+        "subscription": subscription_signal,
+        "savings": savings_signal,
+        "credit": credit_signal,
+        "income": income_signal,
+    }
+    signals: dict[str, dict[str, Any]] = {name: {} for name in SIGNAL_BUILDERS}
+    for name in _signals_needed(persona_id, offer_candidates[:3]):
+        signal = loaded_signals[name]
+        if signal is not None:
+            signals[name] = SIGNAL_BUILDERS[name](signal)
 
-        rationale_parts.append(f"Your cash-flow buffer is {buffer:.1f} months")
-        rationale_parts.append("suggesting opportunity for short-term optimization")
-        rationale_parts.append("This resource might help you improve your cash flow")
+    logger.debug(
+        "candidates_filtered",
+        persona_id=persona_id,
+        education_count=len(education_candidates),
+        offer_count=len(offer_candidates),
+    )
 
-    else:
-        # Generic rationale
-        rationale_parts.append("Based on your financial profile")
-        rationale_parts.append("this resource might be helpful")
+    # Education items (target 3-5) then offers (target 1-3); offers go
+    # through safety + eligibility lazily, in the same pass as rationale/tone
+    candidates = chain(
+        ((item, "education", None) for item in education_candidates[:5]),
+        (
+            (item, "offer", reason)
+            for item, reason in iter_eligible_offers(offer_candidates[:3], signals, user_data)
+        ),
+    )
+    recommendations = [
+        Recommendation(
+            user_id=user_id,
+            persona_id=persona_id,
+            window_days=window_days,  # Store the time window used
+            status="pending",
+            **fields,
+        )
+        for fields in _iter_survivors(candidates, persona_id, signals, rationale_templates)
+    ]
 
-    return ". ".join(rationale_parts) + "."
+    return recommendations
 
 
 def generate_recommendations(
@@ -150,8 +468,8 @@ def generate_recommendations(
     Generate personalized recommendations for a user.
     
     How it works:
-    1. Load persona for user+window
-    2. Load all signals
+    1. Load persona and all signals for user+window (one query)
+    2. Build signals dict
     3. Load content catalog
     4. Filter items by persona tags
     5. Check eligibility for offers
@@ -179,225 +497,115 @@ def generate_recommendations(
         window_days=window_days,
     )
 
-    # Load persona
-    persona = session.query(Persona).filter(
-        Persona.user_id == user_id,
-        Persona.window_days == window_days,
-    ).first()
+    # Load persona and all signals in one round trip
+    context = _load_user_context(session, user_id, window_days)
 
-    if not persona:
+    if context is None:
         logger.warning("no_persona_found", user_id=user_id, window_days=window_days)
         return []
 
-    persona_id = persona.persona_id
-
-    # Load all signals
-    subscription_signal = session.query(SubscriptionSignal).filter(
-        SubscriptionSignal.user_id == user_id,
-        SubscriptionSignal.window_days == window_days,
-    ).first()
-
-    savings_signal = session.query(SavingsSignal).filter(
-        SavingsSignal.user_id == user_id,
-        SavingsSignal.window_days == window_days,
-    ).first()
-
-    credit_signal = session.query(CreditSignal).filter(
-        CreditSignal.user_id == user_id,
-        CreditSignal.window_days == window_days,
-    ).first()
-
-    income_signal = session.query(IncomeSignal).filter(
-        IncomeSignal.user_id == user_id,
-        IncomeSignal.window_days == window_days,
-    ).first()
-
-    # Build signals dict for eligibility and rationale
-    signals = {
-        "subscription": {
-            "recurring_merchant_count": subscription_signal.recurring_merchant_count if subscription_signal else 0,
-            "monthly_recurring_spend": subscription_signal.monthly_recurring_spend if subscription_signal else Decimal("0"),
-            "subscription_share_pct": subscription_signal.subscription_share_pct if subscription_signal else Decimal("0"),
-        } if subscription_signal else {},
-        "savings": {
-            "savings_net_inflow": savings_signal.savings_net_inflow if savings_signal else Decimal("0"),
-            "savings_growth_rate_pct": savings_signal.savings_growth_rate_pct if savings_signal else Decimal("0"),
-            "emergency_fund_months": savings_signal.emergency_fund_months if savings_signal else Decimal("0"),
-        } if savings_signal else {},
-        "credit": {
-            "credit_utilization_max_pct": credit_signal.credit_utilization_max_pct if credit_signal else Decimal("0"),
-            "credit_utilization_avg_pct": credit_signal.credit_utilization_avg_pct if credit_signal else Decimal("0"),
-            "credit_util_flag_30": credit_signal.credit_util_flag_30 if credit_signal else False,
-            "credit_util_flag_50": credit_signal.credit_util_flag_50 if credit_signal else False,
-            "has_interest_charges": credit_signal.has_interest_charges if credit_signal else False,
-            "is_overdue": credit_signal.is_overdue if credit_signal else False,
-        } if credit_signal else {},
-        "income": {
-            "payroll_deposit_count": income_signal.payroll_deposit_count if income_signal else 0,
-            "median_pay_gap_days": income_signal.median_pay_gap_days if income_signal else Decimal("0"),
-            "cashflow_buffer_months": income_signal.cashflow_buffer_months if income_signal else Decimal("0"),
-        } if income_signal else {},
-    }
-
-    # Load content catalog
     catalog = load_content_catalog()
+    persona_id = context[0].persona_id
 
-    # Filter items by persona tags
-    education_candidates = [
-        item for item in catalog.get("education_items", [])
-        if persona_id in item.get("tags", [])
-    ]
+    # Account lookup is only needed when the persona has offers to check
+    user_data: dict[str, Any] = {}
+    if catalog["offers_by_tag"].get(persona_id):
+        user_data = _load_user_data(session, [user_id])[user_id]
 
-    offer_candidates = [
-        item for item in catalog.get("partner_offers", [])
-        if persona_id in item.get("tags", [])
-    ]
+    # Replace any recommendations already stored for this user+window combo
+    _delete_existing_recommendations(session, [user_id], window_days)
 
-    logger.debug(
-        "candidates_filtered",
-        persona_id=persona_id,
-        education_count=len(education_candidates),
-        offer_count=len(offer_candidates),
-    )
+    recommendations = _build_recommendations(user_id, window_days, context, catalog, user_data)
 
-    # Check if recommendations already exist for this user+window combo
-    # If yes, delete them to avoid duplicates
-    existing_recs = session.query(Recommendation).filter(
-        Recommendation.user_id == user_id,
-        Recommendation.window_days == window_days,
-    ).all()
-    
-    if existing_recs:
-        logger.info("deleting_existing_recommendations", user_id=user_id, window_days=window_days, count=len(existing_recs))
-        for rec in existing_recs:
-            session.delete(rec)
-        session.flush()
+    # Insert all recommendations in one flush; ids and defaults come back
+    # from the INSERT, so the schemas can be built without re-selecting rows
+    session.add_all(recommendations)
+    session.flush()
+    result = [RecommendationItem.from_orm_trusted(rec) for rec in recommendations]
 
-    # Build final recommendations
-    recommendations = []
-    seen_titles = set()  # Track titles to avoid duplicates within same generation
+    session.commit()
 
-    # Process education items (target 3-5)
-    for item in education_candidates[:5]:
-        # Skip if we've already added this title
-        if item["title"] in seen_titles:
-            logger.debug("skipping_duplicate_title", title=item["title"])
-            continue
-        rationale = build_rationale(item, persona_id, signals)
+    logger.info(
+        "recommendations_generated",
+        user_id=user_id,
+        window_days=window_days,
+        persona_id=persona_id,
+        education_count=len([r for r in result if r.item_type == "education"]),
+        offer_count=len([r for r in result if r.item_type == "offer"]),
+    )
 
-        # Tone check
-        tone_passed, tone_issues = check_tone(rationale)
-        if not tone_passed:
-            logger.warning(
-                "rationale_tone_failed",
-                item_id=item["id"],
-                issues=tone_issues,
-            )
-            continue  # Skip this item
+    return result
 
-        # Add disclosure
-        item_with_disclosure = add_disclosure(item)
 
-        # Create recommendation record
-        rec = Recommendation(
-            user_id=user_id,
-            persona_id=persona_id,
-            window_days=window_days,  # Store the time window used
-            item_type="education",
-            title=item["title"],
-            rationale=rationale,
-            eligibility_flags=json.dumps({"tone_check": "passed"}),
-            disclosure=item_with_disclosure["disclosure"],
-            status="pending",
-        )
-        session.add(rec)
-        recommendations.append(rec)
-        seen_titles.add(item["title"])  # Mark this title as seen
+def generate_recommendations_batch(
+    user_ids: list[str],
+    window_days: int,
+    session: Session,
+) -> dict[str, list[RecommendationItem]]:
+    """
+    Generate recommendations for many users in one transaction.
+    
+    Same output as calling generate_recommendations per user, but personas,
+    signals, accounts and existing recommendations are each loaded with a
+    single IN query, and everything is inserted with one flush and one commit.
+    Meant for cron/backfill jobs; if anything fails, no user's
+    recommendations are replaced.
+    
+    Args:
+        user_ids: User identifiers
+        window_days: Time window in days (30 or 180)
+        session: SQLAlchemy database session
+    
+    Returns:
+        Dict of user_id -> list of RecommendationItem objects (users without
+        a persona for this window are left out)
+    """
+    user_ids = list(dict.fromkeys(user_ids))  # de-dupe, keep order
+    logger.info("generating_recommendations_batch", user_count=len(user_ids), window_days=window_days)
 
-    # Process offers (target 1-3)
-    for item in offer_candidates[:3]:
-        # Skip if we've already added this title
-        if item["title"] in seen_titles:
-            logger.debug("skipping_duplicate_title", title=item["title"])
-            continue
-        # Safety check
-        if not validate_offer_safety(item):
-            logger.warning("offer_blocked_unsafe", item_id=item["id"])
-            continue
+    if not user_ids:
+        return {}
 
-        # Build user_data for eligibility checks (e.g., existing accounts like savings)
-        accounts = session.query(Account).filter(
-            Account.user_id == user_id,
-            Account.holder_category == "individual",
-        ).all()
-        has_savings_account = any(
-            getattr(acc, "account_subtype", "") == "savings" for acc in accounts
-        )
-        user_data: dict[str, Any] = {
-            "has_savings_account": has_savings_account
-        }
+    contexts: dict[str, UserContext] = {
+        row[0].user_id: (row[0], row[1], row[2], row[3], row[4])
+        for row in _user_context_query(session, window_days).filter(Persona.user_id.in_(user_ids))
+    }
 
-        # Eligibility check
-        eligible, eligibility_reason = check_eligibility(item, signals, user_data)
-        if not eligible:
-            logger.debug(
-                "offer_filtered_ineligible",
-                item_id=item["id"],
-                reason=eligibility_reason,
-            )
-            continue
+    missing = [user_id for user_id in user_ids if user_id not in contexts]
+    if missing:
+        logger.warning("no_persona_found", user_ids=missing, window_days=window_days)
 
-        rationale = build_rationale(item, persona_id, signals)
+    found_ids = [user_id for user_id in user_ids if user_id in contexts]
+    if not found_ids:
+        return {}
 
-        # Tone check
-        tone_passed, tone_issues = check_tone(rationale)
-        if not tone_passed:
-            logger.warning(
-                "rationale_tone_failed",
-                item_id=item["id"],
-                issues=tone_issues,
-            )
-            continue
+    catalog = load_content_catalog()
+    user_data_by_user = _load_user_data(session, found_ids)
 
-        # Add disclosure
-        item_with_disclosure = add_disclosure(item)
+    _delete_existing_recommendations(session, found_ids, window_days)
 
-        # Create recommendation record
-        rec = Recommendation(
-            user_id=user_id,
-            persona_id=persona_id,
-            window_days=window_days,  # Store the time window used
-            item_type="offer",
-            title=item["title"],
-            rationale=rationale,
-            eligibility_flags=json.dumps({
-                "eligible": True,
-                "reason": eligibility_reason,
-                "tone_check": "passed",
-            }),
-            disclosure=item_with_disclosure["disclosure"],
-            status="pending",
+    recommendations_by_user = {
+        user_id: _build_recommendations(
+            user_id, window_days, contexts[user_id], catalog, user_data_by_user[user_id]
         )
-        session.add(rec)
-        recommendations.append(rec)
-        seen_titles.add(item["title"])  # Mark this title as seen
+        for user_id in found_ids
+    }
 
-    # Commit all recommendations
-    session.commit()
+    # One flush for every user's rows, then build schemas from the returned ids
+    session.add_all([rec for recs in recommendations_by_user.values() for rec in recs])
+    session.flush()
+    result = {
+        user_id: [RecommendationItem.from_orm_trusted(rec) for rec in recs]
+        for user_id, recs in recommendations_by_user.items()
+    }
 
-    # Refresh and convert to schemas
-    result = []
-    for rec in recommendations:
-        session.refresh(rec)
-        result.append(RecommendationItem.model_validate(rec))
+    session.commit()
 
     logger.info(
-        "recommendations_generated",
-        user_id=user_id,
+        "recommendations_batch_generated",
+        user_count=len(result),
         window_days=window_days,
-        persona_id=persona_id,
-        education_count=len([r for r in result if r.item_type == "education"]),
-        offer_count=len([r for r in result if r.item_type == "offer"]),
+        recommendation_count=sum(len(items) for items in result.values()),
     )
 
     return result
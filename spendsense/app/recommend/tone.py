@@ -14,12 +14,21 @@ Hybrid approach:
 """
 
 import re
+from functools import lru_cache
 
 from spendsense.app.core.config import settings
 from spendsense.app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Optional dependency (fall back to compiled regexes when missing)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    logger.debug("pyahocorasick not available, tone checks will use regex scanning")
+    AHOCORASICK_AVAILABLE = False
+
 
 # Blocklist of shaming/negative words that should never appear
 SHAMING_KEYWORDS = [
@@ -72,6 +81,82 @@ SUPPORTIVE_WORDS = [
 ]
 
 
+def _compile_phrase_pattern(phrases: list[str]) -> re.Pattern[str]:
+    """
+    Compile a phrase list into one case-insensitive alternation.
+    
+    This is the fallback scanner when pyahocorasick isn't installed.
+    Patterns run against already-lowercased text (_scan_phrases lowers it
+    once), so they don't need re.IGNORECASE.
+    Matches are plain substring matches (no word boundaries), so "help"
+    also matches "helpful". The pattern sits inside a lookahead so
+    finditer reports overlapping phrases too; longest phrases go first so
+    a longer phrase wins over a shorter one starting at the same position.
+    """
+    alternation = "|".join(
+        re.escape(phrase.lower()) for phrase in sorted(phrases, key=len, reverse=True)
+    )
+    return re.compile(f"(?=({alternation}))")
+
+
+# Phrase lists scanned by check_tone, keyed by category
+_PHRASE_CATEGORIES: dict[str, list[str]] = {
+    "shaming": SHAMING_KEYWORDS,
+    "absolute": ABSOLUTE_PHRASES,
+    "supportive": SUPPORTIVE_WORDS,
+}
+
+
+def _build_automaton() -> "ahocorasick.Automaton":
+    """
+    Build one Aho-Corasick automaton over every phrase list.
+    
+    Each phrase maps to (category, phrase), so a single pass over the text
+    finds shaming, absolute and supportive phrases at once, in O(len(text))
+    no matter how many phrases are configured.
+    """
+    automaton = ahocorasick.Automaton()
+    for category, phrases in _PHRASE_CATEGORIES.items():
+        for phrase in phrases:
+            automaton.add_word(phrase.lower(), (category, phrase.lower()))
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import; check_tone runs for every rationale we generate
+_AUTOMATON = _build_automaton() if AHOCORASICK_AVAILABLE else None
+_PHRASE_PATTERNS = {
+    category: _compile_phrase_pattern(phrases)
+    for category, phrases in _PHRASE_CATEGORIES.items()
+}
+_ALL_CAPS_RE = re.compile(r'\b[A-Z]{4,}\b')
+
+
+def _scan_phrases(text: str) -> dict[str, set[str]]:
+    """
+    Return the (lowercased) phrases found in text, grouped by category.
+    
+    Supportive words only need a yes/no answer, so the regex fallback stops
+    at the first one instead of collecting every match.
+    """
+    text_lower = text.lower()
+    found: dict[str, set[str]] = {category: set() for category in _PHRASE_CATEGORIES}
+
+    if _AUTOMATON is not None:
+        for _end, (category, phrase) in _AUTOMATON.iter(text_lower):
+            found[category].add(phrase)
+    else:
+        for category, pattern in _PHRASE_PATTERNS.items():
+            if category == "supportive":
+                match = pattern.search(text_lower)
+                if match:
+                    found[category].add(match.group(1))
+            else:
+                found[category].update(match.group(1) for match in pattern.finditer(text_lower))
+
+    return found
+
+
 def check_tone(text: str) -> tuple[bool, list[str]]:
     """
     Check if text uses supportive, non-shaming tone.
@@ -104,24 +189,47 @@ def check_tone(text: str) -> tuple[bool, list[str]]:
         # passed = True
         # issues = []
     """
+    passed, issue_tuple = _check_tone_cached(text)
+    issues = list(issue_tuple)
+
+    # Log rejections in dev mode
+    if not passed and settings.is_dev:
+        logger.warning(
+            "tone_check_failed",
+            text=text[:100],  # First 100 chars
+            issues=issues,
+        )
+
+    if passed:
+        logger.debug("tone_check_passed", text=text[:50])
+
+    return passed, issues
+
+
+@lru_cache(maxsize=4096)
+def _check_tone_cached(text: str) -> tuple[bool, tuple[str, ...]]:
+    """
+    Run the tone rules for one text, memoized per exact string.
+    
+    Rationales are built from templates, so users with the same persona and
+    similar signals produce identical strings; repeats skip the scan. Returns
+    an immutable tuple so cached results can't be mutated by callers.
+    """
     issues: list[str] = []
-    text_lower = text.lower()
+    found = _scan_phrases(text)
 
     # Check for shaming keywords
     for keyword in SHAMING_KEYWORDS:
-        if keyword.lower() in text_lower:
+        if keyword.lower() in found["shaming"]:
             issues.append(f"Contains shaming keyword: {keyword}")
 
     # Check for absolute phrases
     for phrase in ABSOLUTE_PHRASES:
-        if phrase.lower() in text_lower:
+        if phrase.lower() in found["absolute"]:
             issues.append(f"Contains absolute/judgmental phrase: {phrase}")
 
     # Check for at least one supportive word
-    has_supportive = any(
-        word.lower() in text_lower
-        for word in SUPPORTIVE_WORDS
-    )
+    has_supportive = bool(found["supportive"])
 
     if not has_supportive:
         issues.append("Missing supportive language (should contain words like: consider, might, could, opportunity)")
@@ -132,23 +240,10 @@ def check_tone(text: str) -> tuple[bool, list[str]]:
         issues.append(f"Too many exclamation marks ({exclamation_count}), use at most 1")
 
     # Check for all caps (can feel like shouting)
-    if re.search(r'\b[A-Z]{4,}\b', text):
+    if _ALL_CAPS_RE.search(text):
         issues.append("Contains all-caps words (avoid shouting)")
 
-    passed = len(issues) == 0
-
-    # Log rejections in dev mode
-    if not passed and settings.is_dev:
-        logger.warning(
-            "tone_check_failed",
-            text=text[:100],  # First 100 chars
-            issues=issues,
-        )
-
-    if passed:
-        logger.debug("tone_check_passed", text=text[:50])
-
-    return passed, issues
+    return len(issues) == 0, tuple(issues)
 
 
 def suggest_tone_fix(text: str, issues: list[str]) -> str:
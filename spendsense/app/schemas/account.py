@@ -15,6 +15,9 @@ from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator
 
+from spendsense.app.core.clock import utcnow
+from spendsense.app.schemas.base import ORM_CONFIG, CurrencyCode
+
 
 class AccountBase(BaseModel):
     """
@@ -53,10 +56,9 @@ class AccountBase(BaseModel):
         default="individual",
         description="Account holder type - business accounts are filtered out per PRD"
     )
-    currency: str = Field(
+    currency: CurrencyCode = Field(
         default="USD",
-        description="Currency code (only USD supported in MVP)",
-        max_length=3
+        description="Currency code (only USD supported in MVP)"
     )
     balance_current: Decimal = Field(
         ...,
@@ -74,14 +76,6 @@ class AccountBase(BaseModel):
         decimal_places=2
     )
 
-    @field_validator('currency')
-    @classmethod
-    def validate_currency(cls, v: str) -> str:
-        """Only USD is supported in MVP per PRD."""
-        if v.upper() != "USD":
-            raise ValueError(f"Unsupported currency: {v}. Only USD is supported in MVP.")
-        return v.upper()
-
     @field_validator('holder_category')
     @classmethod
     def validate_holder_category(cls, v: str) -> str:
@@ -104,7 +98,7 @@ class AccountCreate(AccountBase):
     - Ingesting accounts from CSV/JSON
     """
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="When this account was created"
     )
 
@@ -121,10 +115,8 @@ class Account(AccountBase):
     id: int = Field(..., description="Database primary key")
     created_at: datetime
 
-    model_config = {"from_attributes": True}  # Enables ORM mode for SQLAlchemy compatibility
+    model_config = ORM_CONFIG  # Enables ORM mode for SQLAlchemy compatibility
 
 
-class AccountInDB(Account):
-    """Account schema as stored in database."""
-    pass
+AccountInDB = Account  # Account schema as stored in database
 
@@ -0,0 +1,52 @@
+"""
+Shared Pydantic configuration for read schemas.
+
+Why this exists:
+- Every schema built from SQLAlchemy rows needs the same ORM-mode config
+- defer_build postpones building each model's validator until it is first
+  used, so a process only pays for the schemas it actually touches
+- Shared field types (CurrencyCode) keep a field check in one place instead
+  of a copy of the validator on every schema that has the field
+- trusted_fields gives every from_orm_trusted the same rules for reading rows
+"""
+
+import sys
+from collections.abc import Iterable
+from typing import Annotated, Any
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, StringConstraints
+
+# Config for schemas created from SQLAlchemy models (model_validate(orm_obj))
+ORM_CONFIG = ConfigDict(from_attributes=True, defer_build=True)
+
+
+def _require_usd(v: str) -> str:
+    """Only USD is supported in MVP per PRD."""
+    if v != "USD":
+        raise ValueError(f"Unsupported currency: {v}. Only USD is supported in MVP.")
+    return v
+
+
+# Accepts any case and stores "USD" (to_upper runs before the check)
+CurrencyCode = Annotated[str, StringConstraints(to_upper=True), AfterValidator(_require_usd)]
+
+
+def trusted_fields(schema: type[BaseModel], obj: Any, interned: Iterable[str] = ()) -> dict[str, Any]:
+    """
+    Read a schema's fields off one of our own ORM rows, ready for model_construct.
+    
+    Rows we wrote ourselves already have the right types, so callers skip the
+    validator and only decode JSON text columns themselves. Use model_validate
+    for anything that didn't come from our database.
+    
+    Rules:
+    - Fields the row has no attribute for are left out, so the schema's
+      default applies (as with model_validate)
+    - String values of the fields named in `interned` are interned, so a page
+      of rows shares one copy of each low-cardinality value
+    """
+    fields = {name: getattr(obj, name) for name in schema.model_fields if hasattr(obj, name)}
+    for name in interned:
+        if isinstance(fields.get(name), str):
+            fields[name] = sys.intern(fields[name])
+    return fields
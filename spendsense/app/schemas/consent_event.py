@@ -15,6 +15,9 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+from spendsense.app.core.clock import utcnow
+from spendsense.app.schemas.base import ORM_CONFIG
+
 
 class ConsentEventBase(BaseModel):
     """
@@ -54,7 +57,7 @@ class ConsentEventCreate(ConsentEventBase):
     - Operator manages consent
     """
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="When this consent action occurred"
     )
 
@@ -72,12 +75,10 @@ class ConsentEvent(ConsentEventBase):
     id: int = Field(..., description="Database primary key")
     timestamp: datetime
 
-    model_config = {"from_attributes": True}  # Enables ORM mode for SQLAlchemy compatibility
+    model_config = ORM_CONFIG  # Enables ORM mode for SQLAlchemy compatibility
 
 
-class ConsentEventInDB(ConsentEvent):
-    """Consent event schema as stored in database."""
-    pass
+ConsentEventInDB = ConsentEvent  # Consent event schema as stored in database
 
 
 class ConsentStatus(BaseModel):
@@ -15,6 +15,12 @@ from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator
 
+from spendsense.app.core.clock import utcnow
+from spendsense.app.schemas.base import ORM_CONFIG
+
+# Built once; utilization_percentage multiplies by it on every call
+HUNDRED = Decimal("100")
+
 
 class LiabilityBase(BaseModel):
     """
@@ -117,7 +123,7 @@ class LiabilityCreate(LiabilityBase):
     - Ingesting liabilities from CSV/JSON
     """
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="When this liability record was created"
     )
 
@@ -135,7 +141,7 @@ class LiabilityCreate(LiabilityBase):
             balance = 500, limit = 1000 → 50.0%
         """
         if self.credit_limit and self.credit_limit > 0:
-            return (self.current_balance / self.credit_limit) * Decimal("100")
+            return (self.current_balance / self.credit_limit) * HUNDRED
         return None
 
 
@@ -152,7 +158,7 @@ class Liability(LiabilityBase):
     id: int = Field(..., description="Database primary key")
     created_at: datetime
 
-    model_config = {"from_attributes": True}  # Enables ORM mode for SQLAlchemy compatibility
+    model_config = ORM_CONFIG  # Enables ORM mode for SQLAlchemy compatibility
 
     @property
     def utilization_percentage(self) -> Decimal | None:
@@ -168,11 +174,9 @@ class Liability(LiabilityBase):
             balance = 500, limit = 1000 → 50.0%
         """
         if self.credit_limit and self.credit_limit > 0:
-            return (self.current_balance / self.credit_limit) * Decimal("100")
+            return (self.current_balance / self.credit_limit) * HUNDRED
         return None
 
 
-class LiabilityInDB(Liability):
-    """Liability schema as stored in database."""
-    pass
+LiabilityInDB = Liability  # Liability schema as stored in database
 
@@ -8,9 +8,11 @@ Why this exists:
 """
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+from spendsense.app.schemas.base import ORM_CONFIG, trusted_fields
 
 
 class OperatorReviewResponse(BaseModel):
@@ -37,7 +39,12 @@ class OperatorReviewResponse(BaseModel):
     )
     decided_at: datetime = Field(description="When this decision was made")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> "OperatorReviewResponse":
+        """Build from an OperatorReview row without running validation (see trusted_fields)."""
+        return cls.model_construct(**trusted_fields(cls, obj, interned=("status", "reviewer")))
 
 
 class ApprovalRequest(BaseModel):
@@ -75,3 +82,6 @@ class ApprovalResponse(BaseModel):
     message: str = Field(description="Confirmation message")
     review_id: int = Field(description="ID of the created review record")
 
+
+# Built once at import (see RecommendationItemListAdapter)
+OperatorReviewResponseListAdapter = TypeAdapter(list[OperatorReviewResponse])
@@ -7,11 +7,13 @@ Why this exists:
 - Matches the Persona SQLAlchemy model structure
 """
 
-import json
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, Field, field_validator
+
+from spendsense.app.core.json_utils import parse_json_object
+from spendsense.app.schemas.base import ORM_CONFIG, trusted_fields
 
 
 class PersonaCriteria(BaseModel):
@@ -54,23 +56,20 @@ class PersonaAssignment(BaseModel):
     )
     assigned_at: datetime = Field(description="When this persona was assigned")
 
-    model_config = ConfigDict(from_attributes=True)  # Allow creation from SQLAlchemy models
+    model_config = ORM_CONFIG  # Allow creation from SQLAlchemy models
 
     @field_validator("criteria_met", mode="before")
     @classmethod
     def parse_criteria_met(cls, v: Any) -> dict[str, Any] | None:
         """Parse criteria_met if it's a JSON string."""
-        if v is None:
-            return None
-        if isinstance(v, str):
-            try:
-                parsed: dict[str, Any] = json.loads(v)
-                return parsed
-            except json.JSONDecodeError:
-                return None
-        if isinstance(v, dict):
-            return v
-        return None
+        return parse_json_object(v)
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> "PersonaAssignment":
+        """Build from a Persona row without running validation (see trusted_fields)."""
+        fields = trusted_fields(cls, obj, interned=("persona_id",))  # shared across users
+        fields["criteria_met"] = parse_json_object(fields.get("criteria_met"))
+        return cls.model_construct(**fields)
 
 
 class PersonaCreate(BaseModel):
@@ -7,11 +7,13 @@ Why this exists:
 - Provides clean request/response models for feedback
 """
 
-import json
 from datetime import datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from spendsense.app.core.json_utils import parse_json_object
+from spendsense.app.schemas.base import ORM_CONFIG, trusted_fields
 
 
 class RecommendationItem(BaseModel):
@@ -66,23 +68,20 @@ class RecommendationItem(BaseModel):
     )
     created_at: datetime = Field(description="When this recommendation was created")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
     @field_validator("eligibility_flags", mode="before")
     @classmethod
     def parse_eligibility_flags(cls, v: Any) -> dict[str, Any] | None:
         """Parse eligibility_flags if it's a JSON string."""
-        if v is None:
-            return None
-        if isinstance(v, str):
-            try:
-                parsed: dict[str, Any] = json.loads(v)
-                return parsed
-            except json.JSONDecodeError:
-                return None
-        if isinstance(v, dict):
-            return v
-        return None
+        return parse_json_object(v)
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> "RecommendationItem":
+        """Build from a Recommendation row without running validation (see trusted_fields)."""
+        fields = trusted_fields(cls, obj, interned=("persona_id", "item_type", "status"))
+        fields["eligibility_flags"] = parse_json_object(fields.get("eligibility_flags"))
+        return cls.model_construct(**fields)
 
 
 class FeedbackRequest(BaseModel):
@@ -115,3 +114,7 @@ class FeedbackResponse(BaseModel):
     success: bool = Field(description="Whether feedback was recorded")
     message: str = Field(description="Confirmation message")
 
+
+# Built once at import; list endpoints serialize with it directly instead of
+# letting FastAPI re-validate every item against response_model
+RecommendationItemListAdapter = TypeAdapter(list[RecommendationItem])
@@ -9,7 +9,9 @@ Why this exists:
 
 from decimal import Decimal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
+
+from spendsense.app.schemas.base import ORM_CONFIG
 
 
 class SubscriptionSignalData(BaseModel):
@@ -23,7 +25,7 @@ class SubscriptionSignalData(BaseModel):
     monthly_recurring_spend: Decimal = Field(description="Average monthly recurring spend")
     subscription_share_pct: Decimal = Field(description="Subscription spend as % of total spend")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
 
 class SavingsSignalData(BaseModel):
@@ -37,7 +39,7 @@ class SavingsSignalData(BaseModel):
     savings_growth_rate_pct: Decimal = Field(description="Savings growth rate percentage")
     emergency_fund_months: Decimal = Field(description="Emergency fund coverage in months")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
 
 class CreditSignalData(BaseModel):
@@ -56,7 +58,7 @@ class CreditSignalData(BaseModel):
     has_minimum_payment_only: bool = Field(description="Minimum payment only behavior detected")
     is_overdue: bool = Field(description="Any overdue payments")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
 
 class IncomeSignalData(BaseModel):
@@ -72,7 +74,7 @@ class IncomeSignalData(BaseModel):
     avg_payroll_amount: Decimal = Field(description="Average payroll deposit amount")
     cashflow_buffer_months: Decimal = Field(description="Cash-flow buffer in months")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
 
 class SignalSummary(BaseModel):
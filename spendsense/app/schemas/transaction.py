@@ -12,9 +12,21 @@ Why this exists:
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    field_validator,
+)
+from pydantic_core import ErrorDetails
+
+from spendsense.app.core.clock import today, utcnow
+from spendsense.app.schemas.base import ORM_CONFIG, CurrencyCode
 
 
 class TransactionBase(BaseModel):
@@ -35,15 +47,16 @@ class TransactionBase(BaseModel):
         description="Reference to the account for this transaction",
         min_length=1
     )
+    # Any sign is valid: negative amounts are credits, refunds and reversals.
+    # Stricter checks happen in business logic, so there is no amount validator.
     amount: Decimal = Field(
         ...,
         description="Transaction amount (positive = debit/expense, negative = credit/refund)",
         decimal_places=2
     )
-    currency: str = Field(
+    currency: CurrencyCode = Field(
         default="USD",
-        description="Currency code (only USD supported in MVP)",
-        max_length=3
+        description="Currency code (only USD supported in MVP)"
     )
     transaction_date: date = Field(
         ...,
@@ -81,14 +94,6 @@ class TransactionBase(BaseModel):
         description="How the transaction was made"
     )
 
-    @field_validator('currency')
-    @classmethod
-    def validate_currency(cls, v: str) -> str:
-        """Only USD is supported in MVP per PRD."""
-        if v.upper() != "USD":
-            raise ValueError(f"Unsupported currency: {v}. Only USD is supported in MVP.")
-        return v.upper()
-
     @field_validator('transaction_date')
     @classmethod
     def validate_transaction_date(cls, v: date) -> date:
@@ -99,7 +104,7 @@ class TransactionBase(BaseModel):
         - Future dates indicate data errors
         - Can't analyze transactions that haven't happened yet
         """
-        if v > date.today():
+        if v > today():
             raise ValueError(f"Transaction date cannot be in the future: {v}")
         return v
 
@@ -107,29 +112,10 @@ class TransactionBase(BaseModel):
     @classmethod
     def validate_posted_date(cls, v: date | None) -> date | None:
         """Ensure posted date is not in the future if provided."""
-        if v and v > date.today():
+        if v and v > today():
             raise ValueError(f"Posted date cannot be in the future: {v}")
         return v
 
-    @field_validator('amount')
-    @classmethod
-    def validate_amount(cls, v: Decimal, info) -> Decimal:
-        """
-        Validate transaction amount.
-        
-        Why this matters:
-        - Most transactions should be positive (debits)
-        - Negative amounts are OK for credits, refunds, reversals
-        - Zero amounts might indicate data issues (we allow but could warn)
-        
-        Note: We're lenient here since refunds/credits legitimately have
-        negative amounts. Stricter validation happens in business logic.
-        """
-        # Allow negative amounts for refunds/credits
-        # Extremely large amounts might be errors, but we allow them
-        # (could add warning logging in production)
-        return v
-
 
 class TransactionCreate(TransactionBase):
     """
@@ -140,7 +126,7 @@ class TransactionCreate(TransactionBase):
     - Ingesting transactions from CSV/JSON
     """
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="When this transaction record was created"
     )
 
@@ -158,10 +144,48 @@ class Transaction(TransactionBase):
     id: int = Field(..., description="Database primary key")
     created_at: datetime
 
-    model_config = {"from_attributes": True}  # Enables ORM mode for SQLAlchemy compatibility
+    model_config = ORM_CONFIG  # Enables ORM mode for SQLAlchemy compatibility
 
 
-class TransactionInDB(Transaction):
-    """Transaction schema as stored in database."""
-    pass
+TransactionInDB = Transaction  # Transaction schema as stored in database
+
+
+def _keep_record_error(
+    value: Any, handler: ValidatorFunctionWrapHandler
+) -> TransactionCreate | ValidationError:
+    """Validate one record, returning its ValidationError instead of failing the list."""
+    try:
+        record: TransactionCreate = handler(value)
+    except ValidationError as e:
+        return e
+    return record
+
+
+# Built once at import; each invalid record comes back as its own ValidationError
+TransactionCreateListAdapter = TypeAdapter(
+    list[Annotated[TransactionCreate, WrapValidator(_keep_record_error)]]
+)
+
+
+def validate_transactions(
+    records: list[Any],
+) -> tuple[list[TransactionCreate], dict[int, list[ErrorDetails]]]:
+    """
+    Validate a batch of transaction records in a single pass.
+    
+    Args:
+        records: Raw transaction dicts (e.g. parsed JSON)
+    
+    Returns:
+        Tuple of (valid transactions in input order, errors by record index)
+    """
+    valid: list[TransactionCreate] = []
+    errors: dict[int, list[ErrorDetails]] = {}
+
+    for idx, result in enumerate(TransactionCreateListAdapter.validate_python(records)):
+        if isinstance(result, ValidationError):
+            errors[idx] = result.errors()
+        else:
+            valid.append(result)
 
+    return valid, errors
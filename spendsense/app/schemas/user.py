@@ -12,9 +12,12 @@ Why this exists:
 """
 
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints, ValidationInfo, field_validator
+
+from spendsense.app.core.clock import utcnow
+from spendsense.app.schemas.base import ORM_CONFIG
 
 
 class UserBase(BaseModel):
@@ -27,11 +30,9 @@ class UserBase(BaseModel):
     - Response: fields returned from API (may include computed fields)
     """
 
-    user_id: str = Field(
+    user_id: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=100)] = Field(
         ...,
-        description="Masked user identifier (no real PII)",
-        min_length=1,
-        max_length=100
+        description="Masked user identifier (no real PII)"
     )
     email_masked: str | None = Field(
         default=None,
@@ -72,18 +73,10 @@ class UserBase(BaseModel):
     )
     
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="When this user record was created"
     )
 
-    @field_validator('user_id')
-    @classmethod
-    def validate_user_id(cls, v: str) -> str:
-        """Ensure user_id is not empty and properly formatted."""
-        if not v or not v.strip():
-            raise ValueError("user_id cannot be empty")
-        return v.strip()
-
 
 class UserCreate(UserBase):
     """
@@ -113,18 +106,13 @@ class User(UserBase):
 
     id: int = Field(..., description="Database primary key")
 
-    model_config = {"from_attributes": True}  # Enables ORM mode for SQLAlchemy compatibility
+    model_config = ORM_CONFIG  # Enables ORM mode for SQLAlchemy compatibility
 
 
-class UserInDB(User):
-    """
-    User schema as stored in database.
-    
-    This is identical to User for now but allows future
-    database-specific fields (like hashed tokens) without
-    exposing them in API responses.
-    """
-    pass
+# User schema as stored in database. Identical to User for now, so an alias
+# rather than an empty subclass (which would build a second validator); make
+# it a subclass again if database-only fields (like hashed tokens) are added.
+UserInDB = User
 
 
 # Alias for API responses
@@ -189,7 +177,7 @@ class SignupRequest(BaseModel):
     
     @field_validator('password_confirm')
     @classmethod
-    def passwords_match(cls, v: str, info) -> str:
+    def passwords_match(cls, v: str, info: ValidationInfo) -> str:
         """Ensure password and password_confirm match."""
         if 'password' in info.data and v != info.data['password']:
             raise ValueError('Passwords do not match')
@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration.
+
+Runs before any test module imports the app, so settings pick these up.
+"""
+
+import os
+
+# Tests check the auth flow, not hash strength; minimum bcrypt rounds keep
+# each signup/login/seed hash at ~1 ms instead of ~100 ms
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
@@ -0,0 +1,65 @@
+"""
+Shared fixtures for integration tests.
+
+Each module gets one in-memory database; each test runs inside a transaction
+that is rolled back afterwards, so schema creation happens once per module.
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from spendsense.app.db.models import Base
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """
+    Create one in-memory database (schema included) for this module.
+    
+    Why one database:
+    - Schema creation and seeding run once instead of once per test
+    - test_db rolls each test back, so tests stay isolated
+    - Nothing on disk, so commits never wait on fsync
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool  # One shared connection keeps the in-memory DB alive
+    )
+
+    # pysqlite manages transactions itself and breaks SAVEPOINT; hand BEGIN
+    # over to SQLAlchemy (the recipe from the SQLAlchemy SQLite dialect docs)
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def test_db(engine):
+    """
+    Session for a single test; everything it writes is rolled back afterwards.
+    
+    The session joins an outer transaction through a SAVEPOINT, so commits in
+    the test and in the code under test never reach the shared database.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+    connection.close()
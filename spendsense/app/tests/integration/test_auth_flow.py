@@ -4,6 +4,8 @@ Integration tests for authentication flow.
 Tests signup, login, protected routes, and role-based access control.
 """
 
+from uuid import uuid4
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -12,10 +14,33 @@ from spendsense.app.db.session import get_session
 from spendsense.app.db.models import User
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Test client for making HTTP requests."""
-    return TestClient(app)
+    """Test client for making HTTP requests (shared across this module)."""
+    with TestClient(app) as client:
+        yield client
+
+
+def _signup(client, user_id, email_masked="test@example.com"):
+    """Sign up a card_user with the standard test password."""
+    return client.post(
+        "/auth/signup",
+        json={
+            "user_id": user_id,
+            "email_masked": email_masked,
+            "password": "password123",
+            "password_confirm": "password123",
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def card_user(client):
+    """Sign up one card_user per module and return (user_id, access_token)."""
+    user_id = f"card_user_{uuid4().hex[:12]}"
+    response = _signup(client, user_id)
+    assert response.status_code == 201
+    return user_id, response.json()["access_token"]
 
 
 @pytest.fixture
@@ -39,18 +64,9 @@ class TestSignupAndLogin:
     def test_signup_success(self, client, test_db):
         """Test successful user signup."""
         # Use unique user_id to avoid conflicts with other tests
-        import time
-        unique_id = f"test_signup_user_{int(time.time() * 1000)}"
+        unique_id = f"test_signup_user_{uuid4().hex[:12]}"
         
-        response = client.post(
-            "/auth/signup",
-            json={
-                "user_id": unique_id,
-                "email_masked": "test@example.com",
-                "password": "password123",
-                "password_confirm": "password123",
-            }
-        )
+        response = _signup(client, unique_id)
         
         # Route returns 201 Created, not 200
         assert response.status_code == 201
@@ -77,36 +93,19 @@ class TestSignupAndLogin:
         
         # Pydantic validation returns 422 Unprocessable Entity for validation errors
         assert response.status_code == 422
-        # Check that error mentions password
-        response_text = str(response.json()).lower()
-        assert "password" in response_text
+        # The mismatch is reported against the password_confirm field
+        field_errors = response.json()["field_errors"]
+        assert "passwords do not match" in field_errors["body.password_confirm"].lower()
     
     def test_signup_duplicate_user(self, client):
         """Test signup fails with duplicate user_id."""
-        import time
-        unique_id = f"duplicate_user_{int(time.time() * 1000)}"
+        unique_id = f"duplicate_user_{uuid4().hex[:12]}"
         
         # First signup
-        client.post(
-            "/auth/signup",
-            json={
-                "user_id": unique_id,
-                "email_masked": "test1@example.com",
-                "password": "password123",
-                "password_confirm": "password123",
-            }
-        )
+        _signup(client, unique_id, "test1@example.com")
         
         # Second signup with same user_id
-        response = client.post(
-            "/auth/signup",
-            json={
-                "user_id": unique_id,
-                "email_masked": "test2@example.com",
-                "password": "password123",
-                "password_confirm": "password123",
-            }
-        )
+        response = _signup(client, unique_id, "test2@example.com")
         
         # Route returns 409 Conflict for duplicate user
         assert response.status_code == 409
@@ -114,19 +113,10 @@ class TestSignupAndLogin:
     
     def test_login_success(self, client):
         """Test successful login."""
-        import time
-        unique_id = f"login_test_user_{int(time.time() * 1000)}"
+        unique_id = f"login_test_user_{uuid4().hex[:12]}"
         
         # First create a user
-        client.post(
-            "/auth/signup",
-            json={
-                "user_id": unique_id,
-                "email_masked": "login@example.com",
-                "password": "password123",
-                "password_confirm": "password123",
-            }
-        )
+        _signup(client, unique_id, "login@example.com")
         
         # Then login
         response = client.post(
@@ -146,19 +136,10 @@ class TestSignupAndLogin:
     
     def test_login_wrong_password(self, client):
         """Test login fails with wrong password."""
-        import time
-        unique_id = f"wrong_pass_user_{int(time.time() * 1000)}"
+        unique_id = f"wrong_pass_user_{uuid4().hex[:12]}"
         
         # Create user
-        client.post(
-            "/auth/signup",
-            json={
-                "user_id": unique_id,
-                "email_masked": "test@example.com",
-                "password": "password123",
-                "password_confirm": "password123",
-            }
-        )
+        _signup(client, unique_id)
         
         # Try login with wrong password
         response = client.post(
@@ -209,25 +190,9 @@ class TestProtectedRoutes:
         )
         assert response.status_code == 401
     
-    def test_protected_route_with_valid_token(self, client):
+    def test_protected_route_with_valid_token(self, client, card_user):
         """Test protected route succeeds with valid token."""
-        import time
-        unique_id = f"protected_route_user_{int(time.time() * 1000)}"
-        
-        # Create user and get token
-        signup_response = client.post(
-            "/auth/signup",
-            json={
-                "user_id": unique_id,
-                "email_masked": "test@example.com",
-                "password": "password123",
-                "password_confirm": "password123",
-            }
-        )
-        
-        # Ensure signup was successful (201 Created)
-        assert signup_response.status_code == 201
-        token = signup_response.json()["access_token"]
+        user_id, token = card_user
         
         # Access protected route
         response = client.get(
@@ -237,28 +202,12 @@ class TestProtectedRoutes:
         
         assert response.status_code == 200
         data = response.json()
-        assert data["user_id"] == unique_id
+        assert data["user_id"] == user_id
         assert data["role"] == "card_user"
     
-    def test_operator_route_requires_operator_role(self, client):
+    def test_operator_route_requires_operator_role(self, client, card_user):
         """Test operator-only route rejects card_user."""
-        import time
-        unique_id = f"card_user_test_{int(time.time() * 1000)}"
-        
-        # Create card_user
-        signup_response = client.post(
-            "/auth/signup",
-            json={
-                "user_id": unique_id,
-                "email_masked": "test@example.com",
-                "password": "password123",
-                "password_confirm": "password123",
-            }
-        )
-        
-        # Ensure signup was successful
-        assert signup_response.status_code == 201
-        token = signup_response.json()["access_token"]
+        _, token = card_user
         
         # Try to access operator route
         response = client.get(
@@ -269,37 +218,13 @@ class TestProtectedRoutes:
         # Should be forbidden (403)
         assert response.status_code == 403
     
-    def test_user_can_only_access_own_data(self, client):
+    def test_user_can_only_access_own_data(self, client, card_user):
         """Test users can only access their own profile data."""
-        import time
-        timestamp = int(time.time() * 1000)
-        user1_id = f"user1_{timestamp}"
-        user2_id = f"user2_{timestamp}"
-        
-        # Create two users
-        user1_response = client.post(
-            "/auth/signup",
-            json={
-                "user_id": user1_id,
-                "email_masked": "user1@example.com",
-                "password": "password123",
-                "password_confirm": "password123",
-            }
-        )
+        _, user1_token = card_user
+        user2_id = f"user2_{uuid4().hex[:12]}"
         
-        # Ensure user1 signup was successful
-        assert user1_response.status_code == 201
-        user1_token = user1_response.json()["access_token"]
-        
-        user2_response = client.post(
-            "/auth/signup",
-            json={
-                "user_id": user2_id,
-                "email_masked": "user2@example.com",
-                "password": "password123",
-                "password_confirm": "password123",
-            }
-        )
+        # Create a second user
+        user2_response = _signup(client, user2_id, "user2@example.com")
         
         # Ensure user2 signup was successful
         assert user2_response.status_code == 201
@@ -9,30 +9,35 @@ Tests the consent guardrail:
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session
 
-from spendsense.app.db.models import Base, User
+from spendsense.app.db.models import User
 from spendsense.app.db.session import get_db
 from spendsense.app.main import app
 
 
+@pytest.fixture(scope="module")
+def client():
+    """Test client shared across this module (get_db overrides are read per request)."""
+    with TestClient(app) as client:
+        yield client
+
+
 # Override get_db dependency for testing
 @pytest.fixture
-def test_db():
-    """Create a fresh in-memory SQLite database for each test."""
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool  # Use StaticPool for in-memory DB to avoid threading issues
-    )
-    Base.metadata.create_all(engine)
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def test_db(engine):
+    """
+    Point get_db at the shared database with a fresh test user; rolled back afterwards.
+    
+    Every request session joins one outer transaction through a SAVEPOINT, so
+    consent events recorded by a test never leak into the next one.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
 
     def override_get_db():
+        db = Session(bind=connection, join_transaction_mode="create_savepoint")
         try:
-            db = TestingSessionLocal()
             yield db
         finally:
             db.close()
@@ -40,7 +45,7 @@ def test_db():
     app.dependency_overrides[get_db] = override_get_db
 
     # Create a test user
-    db = TestingSessionLocal()
+    db = Session(bind=connection, join_transaction_mode="create_savepoint")
     user = User(user_id="test_consent_user")
     db.add(user)
     db.commit()
@@ -49,15 +54,16 @@ def test_db():
     yield
 
     app.dependency_overrides.clear()
+    transaction.rollback()
+    connection.close()
 
 
-def test_profile_blocked_without_consent(test_db):
+def test_profile_blocked_without_consent(client, test_db):
     """
     Test that /profile returns 403 when user hasn't opted in.
     
     PRD requirement: block processing until explicit opt-in.
     """
-    client = TestClient(app)
 
     # Try to access profile without consent
     response = client.get("/profile/test_consent_user")
@@ -71,11 +77,10 @@ def test_profile_blocked_without_consent(test_db):
     assert "opt_in" in data["detail"]["guidance"]
 
 
-def test_profile_allowed_after_opt_in(test_db):
+def test_profile_allowed_after_opt_in(client, test_db):
     """
     Test that /profile works after user opts in.
     """
-    client = TestClient(app)
 
     # Opt-in
     consent_response = client.post(
@@ -95,13 +100,12 @@ def test_profile_allowed_after_opt_in(test_db):
     assert response.status_code != 403
 
 
-def test_profile_blocked_after_opt_out(test_db):
+def test_profile_blocked_after_opt_out(client, test_db):
     """
     Test that /profile is blocked after user opts out.
     
     Verifies consent can be revoked.
     """
-    client = TestClient(app)
 
     # First opt-in
     client.post(
@@ -131,11 +135,10 @@ def test_profile_blocked_after_opt_out(test_db):
     assert "opt_out" in data["detail"]["consent_status"]
 
 
-def test_recommendations_blocked_without_consent(test_db):
+def test_recommendations_blocked_without_consent(client, test_db):
     """
     Test that /recommendations also requires consent.
     """
-    client = TestClient(app)
 
     # Try to access recommendations without consent
     response = client.get("/recommendations/test_consent_user")
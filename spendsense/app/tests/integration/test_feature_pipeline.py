@@ -20,13 +20,12 @@ from pathlib import Path
 
 import pandas as pd
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
 
 from spendsense.app.core.config import settings
 from spendsense.app.db.models import (
     Account,
-    Base,
     CreditSignal,
     IncomeSignal,
     Liability,
@@ -40,34 +39,34 @@ from spendsense.app.features import credit, income, savings, subscriptions
 
 
 @pytest.fixture
-def integration_db(tmp_path):
+def integration_db(engine):
     """
-    Create a temporary database for integration testing.
+    Session for a single test; everything it writes is rolled back afterwards.
     
-    Why temporary database:
-    - Isolated from real database
-    - Clean slate for each test
-    - Automatically cleaned up after test
+    The session joins an outer transaction through a SAVEPOINT, so commits in
+    the test (including the compute_* functions' own) never reach the shared
+    database and every test sees only the seeded diverse_user data.
     """
-    db_path = tmp_path / "test_integration.db"
-    engine = create_engine(
-        f"sqlite:///{db_path}",
-        connect_args={"check_same_thread": False}
-    )
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
+    connection = engine.connect()
+    transaction = connection.begin()
+    # expire_on_commit=False: the compute_* functions commit before returning,
+    # and the assertions read the returned objects without re-SELECTing them
+    session = Session(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
 
     yield session
 
     session.close()
+    transaction.rollback()
+    connection.close()
 
 
-@pytest.fixture
-def diverse_user(integration_db):
+@pytest.fixture(scope="module")
+def diverse_user(engine):
     """
     Create a user with diverse financial patterns for comprehensive testing.
     
+    Seeded once per module; tests see it through integration_db.
+    
     This user has:
     - Checking and savings accounts
     - Multiple credit cards with varying utilization
@@ -81,8 +80,10 @@ def diverse_user(integration_db):
     - Simulates realistic user data
     - Validates signal interactions
     """
+    session = Session(engine, expire_on_commit=False)
+
     user = User(user_id="user_diverse_001", email_masked="diverse@test.com")
-    integration_db.add(user)
+    session.add(user)
 
     # === ACCOUNTS ===
     # Checking account
@@ -95,7 +96,7 @@ def diverse_user(integration_db):
         holder_category="individual",
         balance_current=Decimal("2500.00")
     )
-    integration_db.add(checking)
+    session.add(checking)
 
     # Savings account
     savings_acc = Account(
@@ -107,7 +108,7 @@ def diverse_user(integration_db):
         holder_category="individual",
         balance_current=Decimal("5000.00")
     )
-    integration_db.add(savings_acc)
+    session.add(savings_acc)
 
     # Credit card
     credit_card = Account(
@@ -120,7 +121,7 @@ def diverse_user(integration_db):
         balance_current=Decimal("1200.00"),
         credit_limit=Decimal("2000.00")
     )
-    integration_db.add(credit_card)
+    session.add(credit_card)
 
     # === LIABILITIES ===
     liability = Liability(
@@ -135,75 +136,78 @@ def diverse_user(integration_db):
         last_payment_amount=Decimal("35.00"),  # Minimum-only
         is_overdue=False
     )
-    integration_db.add(liability)
+    session.add(liability)
 
     # === TRANSACTIONS ===
+    # Built as plain rows and inserted in one bulk INSERT below
+    today = date.today()
+    transactions = []
+
     # Recurring subscriptions (Netflix - 3 occurrences within 90 days, spaced ~10 days apart)
     for i in range(3):
-        tx = Transaction(
-            transaction_id=f"tx_netflix_{i}",
-            account_id="acc_checking",
-            amount=Decimal("14.99"),
-            transaction_date=date.today() - timedelta(days=i*10),  # Every 10 days, not 30
-            merchant_name="Netflix",
-            category="Subscription",
-            transaction_type="debit"
-        )
-        integration_db.add(tx)
+        transactions.append({
+            "transaction_id": f"tx_netflix_{i}",
+            "account_id": "acc_checking",
+            "amount": Decimal("14.99"),
+            "transaction_date": today - timedelta(days=i*10),  # Every 10 days, not 30
+            "merchant_name": "Netflix",
+            "category": "Subscription",
+            "transaction_type": "debit",
+        })
 
     # Payroll deposits (bi-weekly)
     for i in range(4):
-        tx = Transaction(
-            transaction_id=f"tx_payroll_{i}",
-            account_id="acc_checking",
-            amount=Decimal("-3000.00"),  # Credit
-            transaction_date=date.today() - timedelta(days=i*14),
-            merchant_name="Payroll ACH",
-            category="Income",
-            subcategory="Paycheck",
-            transaction_type="credit"
-        )
-        integration_db.add(tx)
+        transactions.append({
+            "transaction_id": f"tx_payroll_{i}",
+            "account_id": "acc_checking",
+            "amount": Decimal("-3000.00"),  # Credit
+            "transaction_date": today - timedelta(days=i*14),
+            "merchant_name": "Payroll ACH",
+            "category": "Income",
+            "subcategory": "Paycheck",
+            "transaction_type": "credit",
+        })
 
     # Monthly expenses
     for i in range(20):
-        tx = Transaction(
-            transaction_id=f"tx_expense_{i}",
-            account_id="acc_checking",
-            amount=Decimal("150.00"),
-            transaction_date=date.today() - timedelta(days=i*2),
-            merchant_name="Store",
-            category="Shopping",
-            transaction_type="debit"
-        )
-        integration_db.add(tx)
+        transactions.append({
+            "transaction_id": f"tx_expense_{i}",
+            "account_id": "acc_checking",
+            "amount": Decimal("150.00"),
+            "transaction_date": today - timedelta(days=i*2),
+            "merchant_name": "Store",
+            "category": "Shopping",
+            "transaction_type": "debit",
+        })
 
     # Savings deposits
     for i in range(2):
-        tx = Transaction(
-            transaction_id=f"tx_savings_{i}",
-            account_id="acc_savings",
-            amount=Decimal("-500.00"),  # Credit
-            transaction_date=date.today() - timedelta(days=i*30),
-            merchant_name="Transfer from Checking",
-            category="Transfer",
-            transaction_type="credit"
-        )
-        integration_db.add(tx)
+        transactions.append({
+            "transaction_id": f"tx_savings_{i}",
+            "account_id": "acc_savings",
+            "amount": Decimal("-500.00"),  # Credit
+            "transaction_date": today - timedelta(days=i*30),
+            "merchant_name": "Transfer from Checking",
+            "category": "Transfer",
+            "transaction_type": "credit",
+        })
 
     # Interest charge on credit card
-    tx_interest = Transaction(
-        transaction_id="tx_interest",
-        account_id="acc_credit",
-        amount=Decimal("25.00"),
-        transaction_date=date.today() - timedelta(days=5),
-        merchant_name="Interest Charge",
-        category="Payment",
-        transaction_type="debit"
-    )
-    integration_db.add(tx_interest)
-
-    integration_db.commit()
+    transactions.append({
+        "transaction_id": "tx_interest",
+        "account_id": "acc_credit",
+        "amount": Decimal("25.00"),
+        "transaction_date": today - timedelta(days=5),
+        "merchant_name": "Interest Charge",
+        "category": "Payment",
+        "transaction_type": "debit",
+    })
+
+    # ORM bulk INSERT: one executemany, no per-object unit-of-work bookkeeping
+    session.execute(insert(Transaction), transactions)
+
+    session.commit()
+    session.close()
 
     return user
 
@@ -257,18 +261,20 @@ def test_full_feature_pipeline_30d(integration_db, diverse_user):
     integration_db.commit()
 
     # === VERIFY PERSISTENCE ===
-    # Query back from database
-    sub_from_db = integration_db.query(SubscriptionSignal).filter_by(
-        user_id="user_diverse_001", window_days=30
-    ).first()
-    assert sub_from_db is not None
-    assert sub_from_db.recurring_merchant_count == 1
-
-    cred_from_db = integration_db.query(CreditSignal).filter_by(
-        user_id="user_diverse_001", window_days=30
-    ).first()
-    assert cred_from_db is not None
-    assert cred_from_db.credit_util_flag_50 is True
+    # Query back single columns; scalar() returns None if the row is missing
+    recurring_count = integration_db.scalar(
+        select(SubscriptionSignal.recurring_merchant_count).filter_by(
+            user_id="user_diverse_001", window_days=30
+        )
+    )
+    assert recurring_count == 1
+
+    util_flag_50 = integration_db.scalar(
+        select(CreditSignal.credit_util_flag_50).filter_by(
+            user_id="user_diverse_001", window_days=30
+        )
+    )
+    assert util_flag_50 is True
 
 
 @pytest.mark.skip(reason="This test requires refactoring compute_window_features to accept a session parameter")
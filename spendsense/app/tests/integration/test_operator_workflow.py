@@ -12,12 +12,9 @@ from decimal import Decimal
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session
 
 from spendsense.app.db.models import (
-    Base,
     CreditSignal,
     Recommendation,
     User,
@@ -29,30 +26,22 @@ from spendsense.app.personas.assign import assign_persona
 from spendsense.app.recommend.engine import generate_recommendations
 
 
-@pytest.fixture
-def test_db_with_recs():
-    """
-    Create a database with a user and recommendations ready for review.
-    """
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool  # Use StaticPool for in-memory DB to avoid threading issues
-    )
-    Base.metadata.create_all(engine)
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-    def override_get_db():
-        try:
-            db = TestingSessionLocal()
-            yield db
-        finally:
-            db.close()
+@pytest.fixture(scope="module")
+def client():
+    """Test client shared across this module (get_db overrides are read per request)."""
+    with TestClient(app) as client:
+        yield client
 
-    app.dependency_overrides[get_db] = override_get_db
 
-    # Set up test data
-    db = TestingSessionLocal()
+@pytest.fixture(scope="module")
+def seeded_recs(engine):
+    """
+    Seed a user and recommendations ready for review, once per module.
+    
+    Persona assignment and recommendation generation are the slow part of
+    setup; test_db_with_recs rolls each test's changes back on top of this.
+    """
+    db = Session(engine)
 
     # Create user
     user = User(user_id="test_operator_user")
@@ -79,22 +68,43 @@ def test_db_with_recs():
     db.commit()
 
     # Assign persona and generate recommendations
-    persona = assign_persona("test_operator_user", 30, db)
-    recs = generate_recommendations("test_operator_user", 30, db)
+    assign_persona("test_operator_user", 30, db)
+    generate_recommendations("test_operator_user", 30, db)
 
     db.close()
 
+
+@pytest.fixture
+def test_db_with_recs(engine, seeded_recs):
+    """
+    Point get_db at the seeded database; approvals are rolled back afterwards.
+    
+    Every request session joins one outer transaction through a SAVEPOINT, so
+    the route's commits stay inside it and the next test sees the seed as-is.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    def override_get_db():
+        db = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+
     yield
 
     app.dependency_overrides.clear()
+    transaction.rollback()
+    connection.close()
 
 
-def test_operator_review_queue(test_db_with_recs):
+def test_operator_review_queue(client, test_db_with_recs):
     """
     Test that operator can see pending recommendations in review queue.
     """
-    client = TestClient(app)
-
     # Get review queue
     response = client.get("/operator/review?status_filter=pending")
 
@@ -112,7 +122,7 @@ def test_operator_review_queue(test_db_with_recs):
     assert "status" in first_rec
 
 
-def test_approve_recommendation(test_db_with_recs):
+def test_approve_recommendation(client, test_db_with_recs):
     """
     Test that operator can approve a recommendation.
     
@@ -121,8 +131,6 @@ def test_approve_recommendation(test_db_with_recs):
     - Recommendation status is updated
     - Decision trace includes reviewer and notes
     """
-    client = TestClient(app)
-
     # Get a recommendation to approve
     queue_response = client.get("/operator/review?status_filter=pending")
     recs = queue_response.json()
@@ -159,12 +167,10 @@ def test_approve_recommendation(test_db_with_recs):
     assert first_review["reviewer"] == "operator_test"
 
 
-def test_reject_recommendation(test_db_with_recs):
+def test_reject_recommendation(client, test_db_with_recs):
     """
     Test that operator can reject a recommendation.
     """
-    client = TestClient(app)
-
     # Get a recommendation to reject
     queue_response = client.get("/operator/review?status_filter=pending&limit=2")
     recs = queue_response.json()
@@ -190,12 +196,10 @@ def test_reject_recommendation(test_db_with_recs):
     assert data["success"] is True
 
 
-def test_operator_pagination(test_db_with_recs):
+def test_operator_pagination(client, test_db_with_recs):
     """
     Test that operator review queue supports pagination.
     """
-    client = TestClient(app)
-
     # Get first page
     response1 = client.get("/operator/review?status_filter=pending&limit=2&offset=0")
     assert response1.status_code == 200
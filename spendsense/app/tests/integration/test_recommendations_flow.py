@@ -19,13 +19,17 @@ from spendsense.app.db.models import (
     CreditSignal,
     IncomeSignal,
     Persona,
+    Recommendation,
     SavingsSignal,
     SubscriptionSignal,
     User,
 )
 from spendsense.app.guardrails.consent import record_consent
 from spendsense.app.personas.assign import assign_persona
-from spendsense.app.recommend.engine import generate_recommendations
+from spendsense.app.recommend.engine import (
+    generate_recommendations,
+    generate_recommendations_batch,
+)
 
 
 @pytest.fixture
@@ -224,3 +228,80 @@ def test_recommendations_have_mandatory_disclosure(test_db):
         assert "not financial advice" in rec.disclosure.lower()
 
 
+def test_batch_matches_single_user_generation(test_db):
+    """
+    Test that batch generation produces the same recommendations as the
+    single-user path, and skips users without a persona.
+    """
+    for user_id in ("test_batch_util", "test_batch_subs", "test_batch_no_persona"):
+        test_db.add(User(user_id=user_id))
+    test_db.add(CreditSignal(
+        user_id="test_batch_util",
+        window_days=30,
+        credit_utilization_max_pct=Decimal("72.0"),
+        credit_utilization_avg_pct=Decimal("65.0"),
+        credit_util_flag_30=True,
+        credit_util_flag_50=True,
+        credit_util_flag_80=False,
+        has_interest_charges=True,
+        has_minimum_payment_only=False,
+        is_overdue=False,
+    ))
+    test_db.add(SubscriptionSignal(
+        user_id="test_batch_subs",
+        window_days=30,
+        recurring_merchant_count=5,
+        monthly_recurring_spend=Decimal("95.00"),
+        subscription_share_pct=Decimal("12.0"),
+    ))
+    test_db.commit()
+    assign_persona("test_batch_util", 30, test_db)
+    assign_persona("test_batch_subs", 30, test_db)
+
+    single = {
+        user_id: generate_recommendations(user_id, 30, test_db)
+        for user_id in ("test_batch_util", "test_batch_subs")
+    }
+    batch = generate_recommendations_batch(
+        ["test_batch_util", "test_batch_subs", "test_batch_no_persona"], 30, test_db
+    )
+
+    assert set(batch) == {"test_batch_util", "test_batch_subs"}
+    for user_id, recs in single.items():
+        assert [(r.item_type, r.title, r.rationale) for r in batch[user_id]] == [
+            (r.item_type, r.title, r.rationale) for r in recs
+        ]
+
+    # Regenerating replaces the earlier rows instead of duplicating them
+    stored = test_db.query(Recommendation).filter(Recommendation.user_id == "test_batch_util").count()
+    assert stored == len(batch["test_batch_util"])
+
+
+def test_batch_leaves_users_without_persona_untouched(test_db):
+    """
+    Test that a user without a persona keeps their existing recommendations
+    when a batch including them runs.
+    """
+    for user_id in ("test_batch_kept", "test_batch_regen"):
+        test_db.add(User(user_id=user_id))
+    test_db.add(Recommendation(
+        user_id="test_batch_kept",
+        window_days=30,
+        item_type="education",
+        title="Earlier recommendation",
+    ))
+    test_db.add(SavingsSignal(
+        user_id="test_batch_regen",
+        window_days=30,
+        savings_net_inflow=Decimal("300.00"),
+        savings_growth_rate_pct=Decimal("3.0"),
+        emergency_fund_months=Decimal("2.5"),
+    ))
+    test_db.commit()
+    assign_persona("test_batch_regen", 30, test_db)
+
+    batch = generate_recommendations_batch(["test_batch_kept", "test_batch_regen"], 30, test_db)
+
+    assert set(batch) == {"test_batch_regen"}
+    kept = test_db.query(Recommendation).filter(Recommendation.user_id == "test_batch_kept").all()
+    assert [rec.title for rec in kept] == ["Earlier recommendation"]
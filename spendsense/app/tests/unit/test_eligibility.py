@@ -0,0 +1,108 @@
+"""
+Unit tests for partner offer eligibility checks.
+
+Tests predatory product blocking, criteria thresholds, and missing signal data.
+"""
+
+from decimal import Decimal
+
+from spendsense.app.recommend.eligibility import (
+    check_eligibility,
+    iter_eligible_offers,
+    validate_offer_safety,
+)
+
+
+class TestCheckEligibility:
+    """
+    Test check_eligibility decisions and reasons.
+
+    Why these tests:
+    - Predatory products must never be offered
+    - Offers should only be shown when the user meets every criterion
+    - Missing signal data must not crash the check
+    """
+
+    def test_predatory_product_blocked(self):
+        """Test that blocked product types are never eligible."""
+        eligible, reason = check_eligibility({"content_type": "payday_loan"}, {})
+
+        assert eligible is False
+        assert "not permitted" in reason
+
+    def test_no_criteria_is_eligible(self):
+        """Test that offers without criteria are eligible."""
+        eligible, reason = check_eligibility({"content_type": "article"}, {})
+
+        assert eligible is True
+        assert reason == "No eligibility restrictions"
+
+    def test_max_utilization(self):
+        """Test utilization threshold with Decimal and float signal values."""
+        item = {"content_type": "balance_transfer", "eligibility_criteria": {"max_utilization": 50}}
+
+        eligible, _ = check_eligibility(item, {"credit": {"credit_utilization_max_pct": Decimal("65.0")}})
+        assert eligible is False
+
+        eligible, _ = check_eligibility(item, {"credit": {"credit_utilization_max_pct": 30.5}})
+        assert eligible is True
+
+    def test_max_utilization_without_credit_data(self):
+        """Test that missing credit data counts as 0% utilization."""
+        item = {"content_type": "balance_transfer", "eligibility_criteria": {"max_utilization": 50}}
+
+        eligible, _ = check_eligibility(item, {"credit": {}})
+
+        assert eligible is True
+
+    def test_min_monthly_bills_without_subscription_data(self):
+        """Test that missing subscription data counts as $0/month."""
+        item = {"content_type": "bill_negotiation", "eligibility_criteria": {"min_monthly_bills": 100}}
+
+        eligible, reason = check_eligibility(item, {"subscription": {}})
+
+        assert eligible is False
+        assert "recurring bills" in reason
+
+    def test_overdue_checked_before_thresholds(self):
+        """Test that the cheap overdue flag is reported before numeric thresholds."""
+        item = {
+            "content_type": "balance_transfer",
+            "eligibility_criteria": {"max_utilization": 30, "not_overdue": True},
+        }
+        signals = {"credit": {"credit_utilization_max_pct": Decimal("90"), "is_overdue": True}}
+
+        eligible, reason = check_eligibility(item, signals)
+
+        assert eligible is False
+        assert reason == "Cannot have overdue payments"
+
+
+class TestValidateOfferSafety:
+    """Test that predatory offers are rejected regardless of user data."""
+
+    def test_high_apr_blocked(self):
+        """Test that offers above 36% APR are unsafe."""
+        assert validate_offer_safety({"content_type": "credit_card", "eligibility_criteria": {"apr": 40}}) is False
+
+    def test_safe_offer(self):
+        """Test that a regular offer is safe."""
+        assert validate_offer_safety({"content_type": "savings_account", "eligibility_criteria": {}}) is True
+
+
+class TestIterEligibleOffers:
+    """Test lazy filtering of candidate offers."""
+
+    def test_keeps_order_and_reasons(self):
+        """Test that only safe, eligible offers survive, in input order."""
+        offers = [
+            {"id": "a", "content_type": "savings_account", "eligibility_criteria": {}},
+            {"id": "b", "content_type": "payday_loan", "eligibility_criteria": {}},
+            {"id": "c", "content_type": "credit_card", "eligibility_criteria": {"min_credit_score": 700}},
+            {"id": "d", "content_type": "budgeting_app", "eligibility_criteria": {}},
+        ]
+
+        result = list(iter_eligible_offers(offers, {}, {"has_savings_account": False}))
+
+        assert [item["id"] for item, _ in result] == ["a", "d"]
+        assert all(reason == "No eligibility restrictions" for _, reason in result)
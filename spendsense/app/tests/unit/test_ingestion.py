@@ -94,33 +94,36 @@ class TestCSVIngestion:
         assert 'not found' in results['errors'][0].lower()
 
 
+@pytest.fixture
+def test_account(test_db):
+    """Create the user and account that JSON transactions reference."""
+    with next(get_session()) as session:
+        from datetime import datetime
+        from decimal import Decimal
+
+        from spendsense.app.db.models import Account
+
+        user = User(user_id="usr_001", email_masked="u@example.com", created_at=datetime.utcnow())
+        account = Account(
+            account_id="acc_001",
+            user_id="usr_001",
+            account_name="Checking",
+            account_type="depository",
+            account_subtype="checking",
+            holder_category="individual",
+            currency="USD",
+            balance_current=Decimal("1000.00"),
+            created_at=datetime.utcnow()
+        )
+        session.add_all([user, account])
+        session.commit()
+
+
 class TestJSONIngestion:
     """Test JSON file ingestion."""
 
-    def test_valid_json_ingestion(self, test_db):
+    def test_valid_json_ingestion(self, test_account):
         """Test that valid JSON data is ingested successfully."""
-        # First create user and account for transaction reference
-        with next(get_session()) as session:
-            from datetime import datetime
-            from decimal import Decimal
-
-            from spendsense.app.db.models import Account, User
-
-            user = User(user_id="usr_001", email_masked="u@example.com", created_at=datetime.utcnow())
-            account = Account(
-                account_id="acc_001",
-                user_id="usr_001",
-                account_name="Checking",
-                account_type="depository",
-                account_subtype="checking",
-                holder_category="individual",
-                currency="USD",
-                balance_current=Decimal("1000.00"),
-                created_at=datetime.utcnow()
-            )
-            session.add_all([user, account])
-            session.commit()
-
         # Create temporary JSON file with transactions
         data = [
             {
@@ -146,6 +149,40 @@ class TestJSONIngestion:
         finally:
             Path(temp_path).unlink()
 
+    def test_invalid_records_reported_individually(self, test_account):
+        """Test that a failed batch reports each invalid record and keeps the valid ones."""
+        data = [
+            {'transaction_id': 'txn_bad_001', 'account_id': 'acc_001', 'transaction_date': '2024-10-15'},
+            {
+                'transaction_id': 'txn_good_001',
+                'account_id': 'acc_001',
+                'amount': '12.50',
+                'transaction_date': '2024-10-15',
+            },
+            {
+                'transaction_id': 'txn_bad_002',
+                'account_id': 'acc_001',
+                'amount': '10.00',
+                'currency': 'EUR',
+                'transaction_date': '2024-10-15',
+                'transaction_type': 'debit'
+            },
+        ]
+
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            json.dump(data, f)
+            temp_path = f.name
+
+        try:
+            results = ingest_from_json(temp_path)
+
+            assert results['success_count'] == 1
+            assert results['error_count'] == 2
+            assert results['errors'][0].startswith('Record 1: amount:')
+            assert results['errors'][1].startswith('Record 3: currency:')
+        finally:
+            Path(temp_path).unlink()
+
     def test_invalid_json_format(self, test_db):
         """Test handling of malformed JSON."""
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
@@ -0,0 +1,89 @@
+"""
+Unit tests for the recommendation tone checker.
+
+Tests blocklist detection, supportive-language requirement, and formatting rules.
+"""
+
+import pytest
+
+from spendsense.app.recommend import tone
+from spendsense.app.recommend.tone import check_tone
+
+
+@pytest.fixture(params=["automaton", "regex"])
+def scanner(request, monkeypatch):
+    """Run each test against both phrase scanners."""
+    if request.param == "automaton":
+        if tone._AUTOMATON is None:
+            pytest.skip("pyahocorasick not installed")
+    else:
+        monkeypatch.setattr(tone, "_AUTOMATON", None)
+    # Results are memoized per text, so start each scanner with a cold cache
+    tone._check_tone_cached.cache_clear()
+    yield request.param
+    tone._check_tone_cached.cache_clear()
+
+
+@pytest.mark.usefixtures("scanner")
+class TestCheckTone:
+    """
+    Test check_tone pass/fail decisions and reported issues.
+
+    Why these tests:
+    - Shaming or judgmental rationales must never reach users
+    - Rationales without supportive language should be rejected
+    - Issue messages are shown to content authors, so they must be stable
+    """
+
+    def test_supportive_text_passes(self):
+        """Test that a supportive rationale passes with no issues."""
+        passed, issues = check_tone("Consider paying more than the minimum.")
+
+        assert passed is True
+        assert issues == []
+
+    def test_shaming_keyword_detected_case_insensitive(self):
+        """Test that shaming keywords are caught regardless of case."""
+        passed, issues = check_tone("You are IRRESPONSIBLE and Reckless, consider a budget.")
+
+        assert passed is False
+        assert "Contains shaming keyword: irresponsible" in issues
+        assert "Contains shaming keyword: reckless" in issues
+
+    def test_each_phrase_reported_once(self):
+        """Test that repeated phrases produce a single issue each."""
+        passed, issues = check_tone("You always overspend, you always forget. This might help.")
+
+        assert passed is False
+        assert issues.count("Contains absolute/judgmental phrase: you always") == 1
+
+    def test_substring_supportive_match(self):
+        """Test that supportive words match inside longer words (helpful -> help)."""
+        passed, issues = check_tone("This resource is helpful.")
+
+        assert passed is True
+        assert issues == []
+
+    def test_missing_supportive_language(self):
+        """Test that text without supportive language fails."""
+        passed, issues = check_tone("Your utilization is 68%.")
+
+        assert passed is False
+        assert any("Missing supportive language" in issue for issue in issues)
+
+    def test_formatting_rules(self):
+        """Test exclamation mark and all-caps checks."""
+        passed, issues = check_tone("Consider this TODAY!!")
+
+        assert passed is False
+        assert "Too many exclamation marks (2), use at most 1" in issues
+        assert "Contains all-caps words (avoid shouting)" in issues
+
+    def test_repeated_text_returns_independent_lists(self):
+        """Test that cached results hand back a fresh issues list each call."""
+        _, first = check_tone("You never save.")
+        first.append("mutated")
+        _, second = check_tone("You never save.")
+
+        assert "mutated" not in second
+        assert tone._check_tone_cached.cache_info().hits >= 1